@@ -1,18 +1,41 @@
 import asyncio
 import json
+import random
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from pydantic_core import PydanticSerializationError
 
 from ..interfaces.llm import EnhancedLLMInterface
 from ..models.agent_type import AgentType
 from ..models.state import BookState
+from ..monitoring import status_updates
+from ..utils.llm_cache import SemanticCache, get_response_cache
 from ..utils.logger import get_logger
 
+# Single writer thread so intermediate snapshots hit the disk in order without
+# blocking the agent that produced them
+_OUTPUT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-output")
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Upper bound for a single retry back-off, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# Minimum seconds between streaming progress updates for one response
+STREAM_STATUS_INTERVAL = 0.5
+
 
 class BaseAgent:
     """Base class for all book generation agents"""
 
+    # Set by ``@cacheable``; ``None`` disables response caching
+    cache_strategy: Optional[str] = None
+
     def __init__(self, llm: EnhancedLLMInterface, agent_type: AgentType):
         if not isinstance(agent_type, AgentType):
             raise ValueError(
@@ -25,7 +48,7 @@ class BaseAgent:
     async def run(self) -> Optional[Dict[str, Any]]:
         """Execute the agent's task"""
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.monotonic()
 
             # Ensure self.prompt exists; otherwise, provide a default or handle error
             current_prompt = getattr(self, "prompt", "")
@@ -37,7 +60,7 @@ class BaseAgent:
             # Use acall_llm for async operations. json_mode is not directly supported by acall_llm's current Ollama flags.
             # If JSON output is needed, it should be requested in the prompt itself.
             response, metadata = await self.llm.acall_llm(current_prompt)
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = time.monotonic() - start_time
 
             return {
                 "response": response,
@@ -52,52 +75,215 @@ class BaseAgent:
 
     async def execute(self, prompt: str, **kwargs) -> str:
         """Execute agent task asynchronously"""
-        response, metrics = await self.llm.acall_llm(prompt, **kwargs)
+        response, metrics = await self._acall_llm(prompt, **kwargs)
         return response
 
     def execute_sync(self, prompt: str, **kwargs) -> str:
         """Execute agent task synchronously"""
-        response, metrics = self.llm.call_llm(prompt, **kwargs)
+        response, metrics = self._call_llm(prompt, **kwargs)
         return response
 
+    @property
+    def cache(self) -> Optional[SemanticCache]:
+        """Response cache for this agent, or ``None`` when caching does not apply.
+
+        Agents marked ``@cacheable`` always use it. Other agents only do when
+        sampling is deterministic (temperature 0); otherwise replaying a stored
+        response would hide the variation the configuration asks for.
+        """
+        config = getattr(self.llm, "system_config", None)
+        if not getattr(config, "cache_responses", False):
+            return None
+        model = getattr(self.llm, "model_config", None)
+        if not self.cache_strategy and getattr(model, "temperature", None) != 0:
+            return None
+        embed_fn = None
+        if self.cache_strategy == "semantic" and getattr(model, "embedding_model", ""):
+            embed_fn = self.llm.embed
+        return get_response_cache(
+            str(Path(config.output_dir) / ".llm_cache.sqlite"), embed_fn
+        )
+
+    def _cache_namespace(
+        self, kwargs: Dict[str, Any], book: Optional[BookState] = None
+    ) -> str:
+        """Key space for cached responses.
+
+        Passing ``book`` scopes entries to that book's topic, audience and
+        style, so a semantic lookup can only match a prompt from the same book.
+        """
+        model = getattr(self.llm, "model_config", None)
+        params = {
+            "model": getattr(model, "name", ""),
+            "temperature": getattr(model, "temperature", None),
+            "top_p": getattr(model, "top_p", None),
+            **kwargs,
+        }
+        if book is not None:
+            params["book"] = [book.topic, book.target_audience, book.book_style]
+        options = json.dumps(params, sort_keys=True, default=str)
+        return f"{self.__class__.__name__}:{options}"
+
+    def _call_llm(
+        self, prompt: str, book: Optional[BookState] = None, **kwargs
+    ) -> Tuple[str, Dict[str, int]]:
+        """``llm.call_llm`` that serves repeated prompts from the cache"""
+        cache = self.cache
+        if cache is None:
+            return self.llm.call_llm(prompt, **kwargs)
+
+        namespace = self._cache_namespace(kwargs, book)
+        semantic = self.cache_strategy == "semantic"
+        cached = cache.get(prompt, namespace, semantic)
+        if cached is not None:
+            return cached, {"input_tokens": 0, "output_tokens": 0}
+        response, metrics = self.llm.call_llm(prompt, **kwargs)
+        if response:
+            cache.put(prompt, response, namespace)
+        return response, metrics
+
+    async def _acall_llm(
+        self, prompt: str, book: Optional[BookState] = None, **kwargs
+    ) -> Tuple[str, Dict[str, int]]:
+        """``llm.acall_llm`` that serves repeated prompts from the cache"""
+        cache = self.cache
+        if cache is None:
+            return await self.llm.acall_llm(prompt, **kwargs)
+
+        namespace = self._cache_namespace(kwargs, book)
+        semantic = self.cache_strategy == "semantic"
+        cached = cache.get(prompt, namespace, semantic)
+        if cached is not None:
+            return cached, {"input_tokens": 0, "output_tokens": 0}
+        response, metrics = await self.llm.acall_llm(prompt, **kwargs)
+        if response:
+            cache.put(prompt, response, namespace)
+        return response, metrics
+
+    async def _astream_llm(self, prompt: str, label: str, **kwargs) -> str:
+        """Stream a response, publishing progress for ``label`` as it arrives"""
+        parts = []
+        received = 0
+        last_update = 0.0
+        async for chunk in self.llm.astream_llm(prompt, **kwargs):
+            parts.append(chunk)
+            received += len(chunk)
+            now = time.monotonic()
+            if now - last_update >= STREAM_STATUS_INTERVAL:
+                last_update = now
+                status_updates.put(
+                    {
+                        "current_agent": self.__class__.__name__,
+                        "item": label,
+                        "streamed_chars": received,
+                    }
+                )
+        return "".join(parts)
+
     def process(self, state: BookState) -> BookState:
         """Run agent logic with retry-based healing and detailed logging."""
         max_retries = self.llm.system_config.max_retries
         delay = self.llm.system_config.retry_delay
+        backoff = delay
 
         for attempt in range(max_retries):
             try:
                 self.logger.debug(
                     f"Starting {self.__class__.__name__} (attempt {attempt + 1})"
                 )
-                result_state = self._execute_logic(state)
-                result_state.completed_steps.append(self.__class__.__name__)
-                if self.llm.system_config.save_intermediates:
-                    self._save_agent_output(result_state, self.__class__.__name__)
-                return result_state
+                return self._record_success(self._execute_logic(state))
             except Exception as e:
-                self.logger.error(
-                    f"Error in {self.__class__.__name__} attempt {attempt + 1}: {e}",
-                    exc_info=True,
+                if self._record_failure(state, e, attempt, max_retries):
+                    return state
+                backoff = self._next_backoff(delay, backoff)
+                time.sleep(backoff)
+
+    async def aprocess(self, state: BookState) -> BookState:
+        """Async variant of ``process`` that backs off without blocking the loop."""
+        max_retries = self.llm.system_config.max_retries
+        delay = self.llm.system_config.retry_delay
+        backoff = delay
+
+        for attempt in range(max_retries):
+            try:
+                self.logger.debug(
+                    f"Starting {self.__class__.__name__} (attempt {attempt + 1})"
                 )
-                if attempt == max_retries - 1:
-                    state.errors.append(f"{self.__class__.__name__}: {e}")
+                return self._record_success(await self._aexecute_logic(state))
+            except Exception as e:
+                if self._record_failure(state, e, attempt, max_retries):
                     return state
-                time.sleep(delay * (2**attempt))
+                backoff = self._next_backoff(delay, backoff)
+                await asyncio.sleep(backoff)
+
+    def _record_success(self, state: BookState) -> BookState:
+        state.completed_steps.append(self.__class__.__name__)
+        if self.llm.system_config.save_intermediates:
+            self._save_agent_output(state, self.__class__.__name__)
+        return state
+
+    def _record_failure(
+        self, state: BookState, error: Exception, attempt: int, max_retries: int
+    ) -> bool:
+        """Log a failed attempt; return ``True`` when no retries are left."""
+        self.logger.error(
+            f"Error in {self.__class__.__name__} attempt {attempt + 1}: {error}",
+            exc_info=True,
+        )
+        if attempt == max_retries - 1:
+            state.errors.append(f"{self.__class__.__name__}: {error}")
+            return True
+        return False
+
+    @staticmethod
+    def _next_backoff(base: float, previous: float) -> float:
+        """Decorrelated jitter so concurrent workers do not retry in lockstep."""
+        return min(MAX_RETRY_DELAY, random.uniform(base, previous * 3))
 
     def _execute_logic(self, state: BookState) -> BookState:
         """Override this method in subclasses"""
         raise NotImplementedError
 
-    def _save_agent_output(self, state: BookState, step_name: str):
-        """Saves the agent's output to a file."""
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Async variant of ``_execute_logic``; runs it in a worker thread by default"""
+        return await asyncio.to_thread(self._execute_logic, state)
+
+    def _save_agent_output(self, state: BookState, step_name: str) -> Optional[Future]:
+        """Snapshot the agent's output and queue it for writing to a file."""
         output_dir = self.llm.system_config.output_dir / "agent_outputs"
         output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path = output_dir / f"{step_name}_{timestamp}.json"
         try:
-            with open(file_path, "w") as f:
-                json.dump(state.dict(), f, indent=2, default=str)
+            payload = self._serialize_state(state)
+        except Exception as e:
+            self.logger.error(f"Failed to save output for {step_name}: {e}")
+            return None
+        return _OUTPUT_WRITER.submit(self._write_output, file_path, payload, step_name)
+
+    @staticmethod
+    def _serialize_state(state: BookState) -> bytes:
+        """Serialize ``state`` to indented JSON straight from pydantic-core.
+
+        Free-form ``metadata`` values pydantic cannot encode fall back to
+        orjson with ``str()``.
+        """
+        try:
+            return state.model_dump_json(indent=2).encode()
+        except PydanticSerializationError:
+            return orjson.dumps(
+                state.model_dump(), default=str, option=orjson.OPT_INDENT_2
+            )
+
+    async def _asave_agent_output(self, state: BookState, step_name: str) -> None:
+        """Async variant of ``_save_agent_output`` that awaits the write."""
+        future = self._save_agent_output(state, step_name)
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    def _write_output(self, file_path: Path, payload: bytes, step_name: str) -> None:
+        try:
+            file_path.write_bytes(payload)
             self.logger.info(f"Saved output for {step_name} to {file_path}")
         except Exception as e:
             self.logger.error(f"Failed to save output for {step_name}: {e}")
@@ -106,23 +292,18 @@ class BaseAgent:
     def _parse_json(response: str) -> Any:
         """Parse JSON from a string, ignoring text before/after the JSON block."""
         try:
-            return json.loads(response)
+            # orjson's decode error subclasses json.JSONDecodeError
+            return orjson.loads(response)
         except json.JSONDecodeError:
             cleaned = response.strip()
-            # Look for object or array delimiters
-            first_obj = cleaned.find("{")
-            last_obj = cleaned.rfind("}")
-            first_arr = cleaned.find("[")
-            last_arr = cleaned.rfind("]")
-            candidates = []
-            if first_obj != -1 and last_obj != -1 and last_obj > first_obj:
-                candidates.append(cleaned[first_obj : last_obj + 1])
-            if first_arr != -1 and last_arr != -1 and last_arr > first_arr:
-                candidates.append(cleaned[first_arr : last_arr + 1])
-            for snippet in candidates:
+            # Decode from the earliest object/array opener; raw_decode stops
+            # at the end of that value, so trailing prose needs no second search
+            starts = sorted(
+                start for start in (cleaned.find("{"), cleaned.find("[")) if start != -1
+            )
+            for start in starts:
                 try:
-                    return json.loads(snippet)
+                    return _JSON_DECODER.raw_decode(cleaned, start)[0]
                 except json.JSONDecodeError:
                     continue
             raise
-
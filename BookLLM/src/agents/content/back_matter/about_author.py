@@ -1,20 +1,43 @@
+import os
 from pathlib import Path
 
 from ....models.agent_type import AgentType
 from ....models.state import BookState
-from ....core.types import Config
+from ....core.types import get_config
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
+_ABOUT_AUTHOR_PLACEHOLDER = " ".join(["Lorem ipsum dolor sit amet"] * 30)
 
+
+@cacheable(strategy="exact-match")
 class AboutAuthorAgent(BaseAgent):
     """Generate an 'About the Author' section"""
 
     def __init__(self, llm, agent_type: AgentType = AgentType.COMPILER):
         super().__init__(llm, agent_type)
-        self.config = Config()
+        self.config = get_config()
 
     def _execute_logic(self, state: BookState) -> BookState:
-        prompt = f"""
+        try:
+            state.about_the_author, _ = self._call_llm(self._build_prompt(state))
+        except Exception as e:
+            self.logger.warning(f"About the Author generation failed: {e}")
+            state.about_the_author = ""
+        return self._finalize(state)
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        try:
+            state.about_the_author, _ = await self._acall_llm(
+                self._build_prompt(state)
+            )
+        except Exception as e:
+            self.logger.warning(f"About the Author generation failed: {e}")
+            state.about_the_author = ""
+        return self._finalize(state)
+
+    def _build_prompt(self, state: BookState) -> str:
+        return f"""
         Write a short biography for the author of this {state.topic} book.
 
         Highlight relevant expertise, notable accomplishments, and connection to the topic.
@@ -22,20 +45,22 @@ class AboutAuthorAgent(BaseAgent):
         Length: 150-200 words.
         """
 
-        try:
-            state.about_the_author, _ = self.llm.call_llm(prompt)
-        except Exception as e:
-            self.logger.warning(f"About the Author generation failed: {e}")
-            state.about_the_author = ""
-
+    def _finalize(self, state: BookState) -> BookState:
+        """Apply the placeholder fallback and write ``about_author.tex``"""
         if not state.about_the_author:
-            placeholder = " ".join(["Lorem ipsum dolor sit amet"] * 30)
-            state.about_the_author = placeholder
+            state.about_the_author = _ABOUT_AUTHOR_PLACEHOLDER
 
         output_dir = Path(self.llm.system_config.output_dir)
         tex_path = output_dir / "about_author.tex"
+        data = memoryview(state.about_the_author.encode("utf-8"))
         try:
-            tex_path.write_text(state.about_the_author)
+            # A raw fd write of the pre-encoded text: no buffered file object
+            fd = os.open(tex_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
         except Exception as e:
             self.logger.warning(f"Failed to write about_author.tex: {e}")
 
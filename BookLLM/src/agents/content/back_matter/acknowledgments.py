@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
 
+@cacheable(strategy="exact-match")
 class AcknowledgmentsAgent(BaseAgent):
     """Generate an acknowledgments section"""
 
@@ -10,11 +12,17 @@ class AcknowledgmentsAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
-        prompt = f"""
+        state.acknowledgments, _ = self._call_llm(self._build_prompt(state))
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        state.acknowledgments, _ = await self._acall_llm(self._build_prompt(state))
+        return state
+
+    def _build_prompt(self, state: BookState) -> str:
+        return f"""
         Draft a sincere acknowledgments section for this {state.topic} book.
 
         Mention key contributors, mentors, peer reviewers, and organizations that supported the work.
         Keep the length between 100 and 150 words.
         """
-        state.acknowledgments, _ = self.llm.call_llm(prompt)
-        return state
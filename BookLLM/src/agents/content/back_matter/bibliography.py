@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable, source_hash
 from ...base import BaseAgent
 
 
+@cacheable(strategy="exact-match")
 class BibliographyAgent(BaseAgent):
     """Generates detailed bibliography"""
 
@@ -14,7 +16,34 @@ class BibliographyAgent(BaseAgent):
         if not state.references:
             return state
 
-        prompt = f"""
+        prompt = self._build_prompt(state)
+        if self._is_current(state, prompt):
+            return state
+        state.bibliography, _ = self._call_llm(prompt)
+        state.metadata["bibliography_source_hash"] = source_hash(prompt)
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Generate comprehensive bibliography without blocking the event loop"""
+        if not state.references:
+            return state
+
+        prompt = self._build_prompt(state)
+        if self._is_current(state, prompt):
+            return state
+        state.bibliography, _ = await self._acall_llm(prompt)
+        state.metadata["bibliography_source_hash"] = source_hash(prompt)
+        return state
+
+    @staticmethod
+    def _is_current(state: BookState, prompt: str) -> bool:
+        """Whether the existing bibliography was built from these references"""
+        return bool(state.bibliography) and state.metadata.get(
+            "bibliography_source_hash"
+        ) == source_hash(prompt)
+
+    def _build_prompt(self, state: BookState) -> str:
+        return f"""
         Create a detailed bibliography for references in {state.topic} book.
 
         References to format:
@@ -27,6 +56,3 @@ class BibliographyAgent(BaseAgent):
         - Add brief annotations where helpful
         - Provide cross-references so citations can be linked to chapters
         """
-
-        state.bibliography, _ = self.llm.call_llm(prompt)
-        return state
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import source_hash
 from ...base import BaseAgent
 
 
@@ -13,11 +14,43 @@ class IndexAgent(BaseAgent):
 
     def _execute_logic(self, state: BookState) -> BookState:
         """Generate detailed index"""
+        prompt = self._build_prompt(state)
+        index_content = self._reusable_index(state, prompt)
+        if index_content is None:
+            index_content, _ = self.llm.call_llm(prompt)
+            state.metadata["index_source_hash"] = source_hash(prompt)
+        state.index_terms = self._process_index(index_content, state)
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Generate detailed index without blocking the event loop"""
+        prompt = self._build_prompt(state)
+        index_content = self._reusable_index(state, prompt)
+        if index_content is None:
+            index_content, _ = await self.llm.acall_llm(prompt)
+            state.metadata["index_source_hash"] = source_hash(prompt)
+        state.index_terms = self._process_index(index_content, state)
+        return state
+
+    def _reusable_index(self, state: BookState, prompt: str) -> Optional[str]:
+        """Return index text that makes the LLM call unnecessary, if any.
+
+        There is nothing to index without chapter content, and an unchanged
+        prompt on a re-run would only reproduce the existing index.
+        """
+        if not any(content.strip() for content in state.chapter_map.values()):
+            return ""
+        previous = state.metadata.get("index_source_hash")
+        if state.index_terms and previous == source_hash(prompt):
+            return "\n".join(state.index_terms)
+        return None
+
+    def _build_prompt(self, state: BookState) -> str:
         combined_content = "\n".join(state.chapter_map.values())
 
-        prompt = f"""
+        return f"""
         Create a comprehensive index for this {state.topic} book.
-        
+
         Content to index:
         {combined_content[:2000]}...
 
@@ -27,24 +60,21 @@ class IndexAgent(BaseAgent):
         - Include technical terms from glossary
         - Format with proper indentation
         - Sort alphabetically
-        
+
         Focus on terms relevant to {state.target_audience}.
         """
 
-        index_content, _ = self.llm.call_llm(prompt)
-        state.index_terms = self._process_index(index_content, state)
-        return state
-
     def _process_index(self, index_content: str, state: BookState) -> List[str]:
         """Process and format index entries"""
         # Remove empty lines and strip whitespace
         entries = [line.strip() for line in index_content.split("\n") if line.strip()]
 
         # Add cross-references for glossary terms
-        terms_only = {e.split("(")[0].strip() for e in entries}
-        for term in state.glossary.keys():
-            if term not in terms_only:
-                entries.append(f"{term} (see Glossary)")
+        terms_only = {e.partition("(")[0].rstrip() for e in entries}
+        unique = set(entries)
+        unique.update(
+            f"{term} (see Glossary)" for term in state.glossary.keys() - terms_only
+        )
 
-        # Remove duplicates and sort alphabetically
-        return sorted(set(entries))
+        # Sort alphabetically
+        return sorted(unique)
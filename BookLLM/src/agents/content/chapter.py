@@ -1,24 +1,111 @@
+import asyncio
+import hashlib
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
 from ...models.agent_type import AgentType
 from ...models.state import BookState
-from ...utils import log_progress_json
+from ...utils import log_progress_json, run_async
 from ..base import BaseAgent
+from .front_matter.table_of_contents import TableOfContentsAgent
+
+CHAPTER_TEMPLATE = """Write a comprehensive chapter for a book using the chapter-specific inputs at the end of this prompt.
+
+REQUIRED UNIFIED TEMPLATE STRUCTURE:
+
+1. **Opening Scenario** (1-2 sentences):
+   Start with a vivid, real-world scenario or compelling "why this matters" statement that immediately demonstrates the importance of this chapter's topic. Make it concrete and relatable.
+
+2. **Chapter Overview & Estimated Time**:
+   - Brief description of what this chapter covers
+   - Estimated reading time based on content length
+
+3. **Learning Objectives** (3-5 bullet points):
+   Clear, actionable objectives starting with "By the end of this chapter, you will be able to:"
+   - Use active verbs (identify, analyze, create, implement, etc.)
+   - Make objectives specific and measurable
+
+4. **Core Content** (2000-2500 words with subheads):
+   - Use descriptive subheadings that preview the content
+   - Include practical examples within each section
+   - Focus on actionable insights, not just theory
+   - Use active voice and conversational tone
+
+5. **Case Study/Example** (400-500 words):
+   A detailed, realistic scenario that demonstrates the chapter concepts in action:
+   - Include specific details (company names, numbers, timelines)
+   - Show the problem, approach, and outcome
+   - Highlight key success factors or lessons learned
+
+6. **Key Takeaways** (3-5 bullet points):
+   The most important points readers should remember:
+   - Start each with an action verb
+   - Make them practical and implementable
+   - Connect back to learning objectives
+
+7. **Glossary Terms**:
+   Define 5-8 key terms used in the chapter:
+   - Include term name and clear, concise definition
+   - Focus on terms essential to understanding the topic
+
+STYLE REQUIREMENTS:
+- Use active voice throughout
+- Keep sentences concise and clear
+- Include specific examples and data points
+- Make content immediately actionable
+- Use proper Markdown formatting with clear headers
+
+Target Length: 3500-4000 words total"""
+
+# Stable identifier for the shared prefix, used as a provider prompt-cache key
+CHAPTER_TEMPLATE_KEY = hashlib.sha256(CHAPTER_TEMPLATE.encode()).hexdigest()[:16]
+
+# Both patterns start with a literal, so the regex engine jumps straight to the
+# next "!" or "["; the link lookbehind sits after the bracket for the same
+# reason. Table rows, code fences and "example" use plain string searches.
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[(?<!!\[)[^\]]+\]\([^)]*\)")
+
+
+def _count_word(text: str, word: str) -> int:
+    """Count whole-word occurrences of ``word`` (as ``\\bword\\b`` would)"""
+    count = 0
+    start = text.find(word)
+    while start != -1:
+        end = start + len(word)
+        before = text[start - 1] if start else " "
+        after = text[end] if end < len(text) else " "
+        if not (before.isalnum() or before == "_") and not (
+            after.isalnum() or after == "_"
+        ):
+            count += 1
+        start = text.find(word, end)
+    return count
 
 
 class ChapterWriterAgent(BaseAgent):
     """Handles chapter content generation"""
 
+    # Number of preceding chapters summarised in each chapter prompt
+    PREVIOUS_CONTEXT_CHAPTERS = 5
+
     def __init__(self, llm, agent_type: AgentType = AgentType.CONTENT_CREATOR):
         super().__init__(llm, agent_type)
+        # Per-run lookups for ``state.chapters``, rebuilt by ``_index_chapters``
+        self._indexed_chapters: Optional[List[str]] = None
+        self._chapter_index: Dict[str, int] = {}
+        self._slugs: Dict[str, str] = {}
+        self._context_lines: List[str] = []
 
     def _execute_logic(self, state: BookState) -> BookState:
         """Execute chapter writing based on configuration"""
+        self._index_chapters(state)
         if self.llm.system_config.parallel_agents:
-            return self._write_chapters_parallel(state)
+            return run_async(self._write_chapters_parallel(state))
         else:
             return self._write_chapters_sequential(state)
 
@@ -33,44 +120,142 @@ class ChapterWriterAgent(BaseAgent):
                 pbar.update(1)
         return state
 
-    def _write_chapters_parallel(self, state: BookState) -> BookState:
-        """Write chapters in parallel"""
-        with ThreadPoolExecutor(
-            max_workers=self.llm.system_config.max_workers
-        ) as executor:
-            future_to_chapter = {
-                executor.submit(self._write_single_chapter, title, state, i): title
-                for i, title in enumerate(state.chapters)
-            }
-            total = len(state.chapters)
-            with tqdm(total=total, desc="Chapters", unit="chapter") as pbar:
-                for future in as_completed(future_to_chapter):
-                    title = future_to_chapter[future]
-                    try:
-                        content = future.result()
+    async def _write_chapters_parallel(self, state: BookState) -> BookState:
+        """Write chapters concurrently.
+
+        Chapters are grouped into batches of ``batch_size`` prompts that are
+        submitted together. A rolling window keeps at most ``max_workers``
+        batches in flight; each batch's completion callback records its
+        chapters and starts the next one, so long books never hold a task per
+        chapter at once and no waiters are re-armed per completion.
+        With ``stream_chapters`` each prompt in a batch is streamed instead.
+        """
+        config = self.llm.system_config
+        batch_size = max(1, config.batch_size)
+        # Chapters already written (e.g. on resume) are not regenerated
+        indexed = [
+            (i, title)
+            for i, title in enumerate(state.chapters)
+            if not state.chapter_map.get(title)
+        ]
+        batches = iter(
+            indexed[i : i + batch_size] for i in range(0, len(indexed), batch_size)
+        )
+
+        total = len(state.chapters)
+        finished = asyncio.get_running_loop().create_future()
+        pending = 0
+
+        with tqdm(
+            total=total,
+            initial=total - len(indexed),
+            desc="Chapters",
+            unit="chapter",
+            mininterval=0.5,
+        ) as pbar:
+
+            def on_done(task: asyncio.Task) -> None:
+                # Runs on the event loop thread, so no locking is needed
+                nonlocal pending
+                pending -= 1
+                if finished.done():
+                    return
+                if task.exception() is not None:
+                    finished.set_exception(task.exception())
+                    return
+                results = task.result()
+                for title, content, error in results:
+                    if error is None:
                         state.chapter_map[title] = content
                         self.logger.info(f"✅ Completed chapter: {title}")
-                    except Exception as e:
-                        error_msg = f"Failed to write chapter '{title}': {e}"
+                    else:
+                        error_msg = f"Failed to write chapter '{title}': {error}"
                         self.logger.error(error_msg)
                         state.errors.append(error_msg)
-                    pbar.update(1)
+                pbar.update(len(results))
+                launch(next(batches, None))
+
+            def launch(batch) -> None:
+                nonlocal pending
+                if batch is None:
+                    if not pending and not finished.done():
+                        finished.set_result(None)
+                    return
+                pending += 1
+                task = asyncio.ensure_future(self._write_chapter_batch(batch, state))
+                task.add_done_callback(on_done)
+
+            for batch in islice(batches, max(1, config.max_workers)):
+                launch(batch)
+            launch(None)
+            await finished
 
         return state
 
+    async def _write_chapter_batch(
+        self, batch: List[Tuple[int, str]], state: BookState
+    ) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Generate a batch of chapters with one batched LLM submission"""
+        prompts = []
+        for index, title in batch:
+            log_progress_json(self.logger, self.__class__.__name__, title, "started")
+            prompts.append(self._prepare_chapter_prompt(title, state, index))
+
+        stream = getattr(self.llm.system_config, "stream_chapters", False)
+        if stream:
+            responses = await asyncio.gather(
+                *(self._astream_chapter(p) for p in prompts), return_exceptions=True
+            )
+        else:
+            responses = await self.llm.acall_llm_batch(
+                prompts, return_exceptions=True, cache_key=CHAPTER_TEMPLATE_KEY
+            )
+
+        results = []
+        for (_, title), response in zip(batch, responses):
+            if isinstance(response, Exception):
+                log_progress_json(self.logger, self.__class__.__name__, title, "failed")
+                results.append((title, None, response))
+                continue
+            # Streamed responses carry statistics counts instead of token usage
+            content, extra = response
+            processed = self._post_process_chapter(
+                content, state, title, extra if stream else None
+            )
+            log_progress_json(self.logger, self.__class__.__name__, title, "completed")
+            results.append((title, processed, None))
+        return results
+
+    async def _astream_chapter(self, prompt: str) -> Tuple[str, Counter]:
+        """Stream one chapter, counting statistics over each completed line.
+
+        The scan of finished lines overlaps with generation of the rest, so
+        little post-processing is left once the stream ends.
+        """
+        parts: List[str] = []
+        counts: Counter = Counter()
+        pending = ""
+        async for chunk in self.llm.astream_llm(prompt, cache_key=CHAPTER_TEMPLATE_KEY):
+            parts.append(chunk)
+            pending += chunk
+            # Keep the last newline pending so "\n|" table rows are never split
+            cut = pending.rfind("\n")
+            if cut > 0:
+                counts.update(self._count_statistics(pending[:cut]))
+                pending = pending[cut:]
+        counts.update(self._count_statistics(pending))
+        return "".join(parts).strip(), counts
+
     def _write_single_chapter(
         self, title: str, state: BookState, chapter_index: int
     ) -> str:
         """Generate content for a single chapter"""
+        if state.chapter_map.get(title):
+            return state.chapter_map[title]  # Already written, e.g. on resume
         log_progress_json(self.logger, self.__class__.__name__, title, "started")
         try:
-            previous_chapters = self._get_previous_chapters_context(
-                state, chapter_index
-            )
-            prompt = self._build_chapter_prompt(
-                title, state, chapter_index, previous_chapters
-            )
-            content, _ = self.llm.call_llm(prompt)
+            prompt = self._prepare_chapter_prompt(title, state, chapter_index)
+            content, _ = self.llm.call_llm(prompt, cache_key=CHAPTER_TEMPLATE_KEY)
             processed = self._post_process_chapter(content, state, title)
             log_progress_json(self.logger, self.__class__.__name__, title, "completed")
             return processed
@@ -78,71 +263,68 @@ class ChapterWriterAgent(BaseAgent):
             log_progress_json(self.logger, self.__class__.__name__, title, "failed")
             raise
 
+    def _prepare_chapter_prompt(
+        self, title: str, state: BookState, chapter_index: int
+    ) -> str:
+        """Gather previous-chapter context and build the chapter prompt"""
+        previous_chapters = self._get_previous_chapters_context(state, chapter_index)
+        return self._build_chapter_prompt(
+            title, state, chapter_index, previous_chapters
+        )
+
     def _build_chapter_prompt(
         self, title: str, state: BookState, chapter_index: int, previous_chapters: str
     ) -> str:
-        """Build detailed chapter generation prompt using unified template"""
-        return f"""
-        Write a comprehensive chapter titled "{title}" for a book on "{state.topic}".
-        
-        Context:
-        - Target audience: {state.target_audience}
-        - Book style: {state.book_style}
-        - Chapter {chapter_index + 1} of {len(state.chapters)}
-        - Previous chapters: {previous_chapters}
-        
-        REQUIRED UNIFIED TEMPLATE STRUCTURE:
-
-        1. **Opening Scenario** (1-2 sentences):
-           Start with a vivid, real-world scenario or compelling "why this matters" statement that immediately demonstrates the importance of this chapter's topic. Make it concrete and relatable.
-
-        2. **Chapter Overview & Estimated Time**:
-           - Brief description of what this chapter covers
-           - Estimated reading time based on content length
-           
-        3. **Learning Objectives** (3-5 bullet points):
-           Clear, actionable objectives starting with "By the end of this chapter, you will be able to:"
-           - Use active verbs (identify, analyze, create, implement, etc.)
-           - Make objectives specific and measurable
-           
-        4. **Core Content** (2000-2500 words with subheads):
-           - Use descriptive subheadings that preview the content
-           - Include practical examples within each section
-           - Focus on actionable insights, not just theory
-           - Use active voice and conversational tone
-           
-        5. **Case Study/Example** (400-500 words):
-           A detailed, realistic scenario that demonstrates the chapter concepts in action:
-           - Include specific details (company names, numbers, timelines)
-           - Show the problem, approach, and outcome
-           - Highlight key success factors or lessons learned
-           
-        6. **Key Takeaways** (3-5 bullet points):
-           The most important points readers should remember:
-           - Start each with an action verb
-           - Make them practical and implementable
-           - Connect back to learning objectives
-           
-        7. **Glossary Terms**:
-           Define 5-8 key terms used in the chapter:
-           - Include term name and clear, concise definition
-           - Focus on terms essential to understanding the topic
-           
-        STYLE REQUIREMENTS:
-        - Use active voice throughout
-        - Keep sentences concise and clear
-        - Include specific examples and data points
-        - Make content immediately actionable
-        - Use proper Markdown formatting with clear headers
-        
-        Target Length: 3500-4000 words total
+        """Build the chapter prompt: shared prefix first, chapter inputs last.
+
+        The template and the book-level inputs are identical for every chapter
+        of a book, so provider-side prompt caches can reuse that prefix instead
+        of re-running prefill.
         """
+        suffix = self._dynamic_suffix(title, state, chapter_index, previous_chapters)
+        return (
+            f"{CHAPTER_TEMPLATE}\n\n{self._book_inputs(state)}"
+            f"\n---\nChapter-specific inputs:\n{suffix}"
+        )
+
+    @staticmethod
+    def _book_inputs(state: BookState) -> str:
+        """Return the inputs shared by every chapter of the book"""
+        return (
+            "Book inputs:\n"
+            f'- Book topic: "{state.topic}"\n'
+            f"- Target audience: {state.target_audience}\n"
+            f"- Book style: {state.book_style}\n"
+            f"- Total chapters: {len(state.chapters)}"
+        )
 
-    def _post_process_chapter(self, content: str, state: BookState, title: str) -> str:
-        """Post-process chapter content"""
+    def _dynamic_suffix(
+        self, title: str, state: BookState, chapter_index: int, previous_chapters: str
+    ) -> str:
+        """Return the chapter-specific part of the prompt"""
+        return (
+            f'- Chapter title: "{title}"\n'
+            f"- Chapter {chapter_index + 1} of {len(state.chapters)}\n"
+            f"- Previous chapters: {previous_chapters}"
+        )
+
+    def _post_process_chapter(
+        self,
+        content: str,
+        state: BookState,
+        title: str,
+        counts: Optional[Counter] = None,
+    ) -> str:
+        """Post-process chapter content.
+
+        ``counts`` holds statistics already gathered while the chapter was
+        streamed; without it the content is scanned here.
+        """
         try:
             # Update statistics
-            self._update_chapter_statistics(content, state)
+            if counts is None:
+                counts = self._count_statistics(content)
+            self._apply_statistics(counts, state)
 
             # Add navigation
             nav_header = self._create_navigation_header(title, state)
@@ -150,7 +332,7 @@ class ChapterWriterAgent(BaseAgent):
             # Add reading time
             reading_info = self._create_reading_info(content)
 
-            index = state.chapters.index(title)
+            index = self._chapter_position(title, state)
             header = f"# Chapter {index + 1}: {title}"
 
             return f"{header}\n{nav_header}\n{reading_info}\n{content}"
@@ -162,48 +344,86 @@ class ChapterWriterAgent(BaseAgent):
     def _get_previous_chapters_context(
         self, state: BookState, current_index: int
     ) -> str:
-        """Get context from previous chapters"""
-        return "\n".join(
-            f"Chapter {i+1}: {ch_title} - {state.chapter_summaries.get(ch_title, 'No summary')}"
-            for i, ch_title in enumerate(state.chapters[:current_index])
-        )
+        """Get context from the most recent previous chapters.
+
+        Only the last ``PREVIOUS_CONTEXT_CHAPTERS`` are included so prompt size
+        stays constant instead of growing with every chapter of the book.
+        """
+        if state.chapters is not self._indexed_chapters:
+            self._index_chapters(state)
+        start = max(0, current_index - self.PREVIOUS_CONTEXT_CHAPTERS)
+        return "\n".join(self._context_lines[start:current_index])
 
     def _update_chapter_statistics(self, content: str, state: BookState) -> None:
         """Update basic statistics for the chapter content."""
-        image_pattern = re.compile(r"!\[[^\]]*\]\([^)]*\)")
-        link_pattern = re.compile(r"(?<!!)\[[^\]]+\]\([^)]*\)")
+        self._apply_statistics(self._count_statistics(content), state)
+
+    @staticmethod
+    def _count_statistics(content: str) -> Counter:
+        """Count statistic matches in ``content`` (code fences, not blocks)"""
+        return Counter(
+            img=len(_IMAGE_RE.findall(content)),
+            lnk=len(_LINK_RE.findall(content)),
+            tbl=content.count("\n|"),
+            code=content.count("```"),
+            ex=_count_word(content.lower(), "example"),
+        )
 
-        images = len(image_pattern.findall(content))
-        links = len(link_pattern.findall(content))
-        tables = len(re.findall(r"\n\|", content))
-        code_blocks = content.count("```") // 2
-        examples = len(re.findall(r"\bexample\b", content, re.IGNORECASE))
+    @staticmethod
+    def _apply_statistics(counts: Counter, state: BookState) -> None:
+        state.total_images += counts["img"]
+        state.total_references += counts["lnk"]
+        state.total_tables += counts["tbl"]
+        state.total_code_blocks += counts["code"] // 2
+        state.total_examples += counts["ex"]
 
-        state.total_images += images
-        state.total_references += links
-        state.total_tables += tables
-        state.total_code_blocks += code_blocks
-        state.total_examples += examples
+    def _index_chapters(self, state: BookState) -> None:
+        """Cache per-chapter lookups (position, slug, context line) for this run"""
+        self._chapter_index = {}
+        for i, title in enumerate(state.chapters):
+            self._chapter_index.setdefault(title, i)
+        # Same anchors as the table of contents, so both link to the headings
+        self._slugs = TableOfContentsAgent.chapter_anchors(state.chapters)
+        self._context_lines = [
+            f"Chapter {i + 1}: {title} - {state.chapter_summaries.get(title, 'No summary')}"
+            for i, title in enumerate(state.chapters)
+        ]
+        self._indexed_chapters = state.chapters
+
+    def _chapter_position(self, title: str, state: BookState) -> int:
+        """Index of ``title`` in ``state.chapters`` without a linear search"""
+        if state.chapters is not self._indexed_chapters:
+            self._index_chapters(state)
+        return self._chapter_index[title]
 
     def _create_navigation_header(self, title: str, state: BookState) -> str:
         """Create simple navigation links between chapters."""
-        index = state.chapters.index(title)
+        index = self._chapter_position(title, state)
         prev_chapter = state.chapters[index - 1] if index > 0 else None
         next_chapter = (
             state.chapters[index + 1] if index + 1 < len(state.chapters) else None
         )
+        slugs = self._slugs
+
+        if prev_chapter and next_chapter:
+            return (
+                f"[<< {prev_chapter}](#{slugs[prev_chapter]}) | **{title}** | "
+                f"[{next_chapter} >>](#{slugs[next_chapter]})"
+            )
 
         parts = []
         if prev_chapter:
-            parts.append(f"[<< {prev_chapter}](#{prev_chapter.replace(' ', '-')})")
+            parts.append(f"[<< {prev_chapter}](#{slugs[prev_chapter]})")
         parts.append(f"**{title}**")
         if next_chapter:
-            parts.append(f"[{next_chapter} >>](#{next_chapter.replace(' ', '-')})")
+            parts.append(f"[{next_chapter} >>](#{slugs[next_chapter]})")
 
         return " | ".join(parts)
 
     def _create_reading_info(self, content: str) -> str:
         """Return an estimated reading time string for the chapter."""
-        words = len(content.split())
+        # Spaces approximate the word count closely enough for a rounded
+        # minute estimate without building a list of every word
+        words = content.count(" ") + 1
         minutes = max(1, int(words / 200))
         return f"_Estimated reading time: {minutes} minute(s)_"
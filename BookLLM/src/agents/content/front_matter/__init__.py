@@ -1,11 +1,17 @@
-from .book_title import BookTitleAgent
-from .dedication import DedicationAgent
-from .epigraph import EpigraphAgent
-from .foreword import ForewordAgent
-from .preface import PrefaceAgent
-from .prologue import PrologueAgent
-from .table_of_contents import TableOfContentsAgent
-from .title_page import TitlePageAgent
+import importlib
+
+# Agent modules are imported on first access (PEP 562); the writer loads the
+# ones it needs itself, so importing the package stays cheap
+_AGENT_MODULES = {
+    "BookTitleAgent": ".book_title",
+    "DedicationAgent": ".dedication",
+    "EpigraphAgent": ".epigraph",
+    "ForewordAgent": ".foreword",
+    "PrefaceAgent": ".preface",
+    "PrologueAgent": ".prologue",
+    "TableOfContentsAgent": ".table_of_contents",
+    "TitlePageAgent": ".title_page",
+}
 
 __all__ = [
     "TitlePageAgent",
@@ -17,3 +23,16 @@ __all__ = [
     "PrefaceAgent",
     "PrologueAgent",
 ]
+
+
+def __getattr__(name):
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    agent_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = agent_class
+    return agent_class
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
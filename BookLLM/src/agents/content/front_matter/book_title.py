@@ -26,7 +26,7 @@ class BookTitleAgent(BaseAgent):
         Return a JSON object with keys 'title' and 'subtitle'.
         """
 
-        response, _ = self.llm.call_llm(prompt, json_mode=True)
+        response, _ = self._call_llm(prompt, json_mode=True)
         try:
             data = self._parse_json(response)
             state.book_title = data.get("title") or state.topic
@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
 
+@cacheable(strategy="semantic")
 class DedicationAgent(BaseAgent):
     """Generates meaningful dedication for the book"""
 
@@ -25,5 +27,5 @@ class DedicationAgent(BaseAgent):
         - Future generations
         """
 
-        state.dedication, _ = self.llm.call_llm(prompt)
+        state.dedication, _ = self._call_llm(prompt, book=state)
         return state
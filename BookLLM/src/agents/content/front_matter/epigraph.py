@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
 
+@cacheable(strategy="semantic")
 class EpigraphAgent(BaseAgent):
     """Generates inspiring epigraph for the book"""
 
@@ -24,5 +26,5 @@ class EpigraphAgent(BaseAgent):
         Format as: "> Quote\n> -- Attribution"
         """
 
-        state.epigraph, _ = self.llm.call_llm(prompt)
+        state.epigraph, _ = self._call_llm(prompt, book=state)
         return state
@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
 
+@cacheable(strategy="semantic")
 class ForewordAgent(BaseAgent):
     """Generates engaging foreword for the book"""
 
@@ -29,5 +31,5 @@ class ForewordAgent(BaseAgent):
         - End with a compelling call to read
         """
 
-        state.foreword, _ = self.llm.call_llm(prompt)
+        state.foreword, _ = self._call_llm(prompt, book=state)
         return state
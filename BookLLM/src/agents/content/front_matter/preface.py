@@ -1,8 +1,10 @@
 from ....models.agent_type import AgentType
 from ....models.state import BookState
+from ....utils.llm_cache import cacheable
 from ...base import BaseAgent
 
 
+@cacheable(strategy="semantic")
 class PrefaceAgent(BaseAgent):
     """Generates compelling preface for the book"""
 
@@ -36,5 +38,5 @@ class PrefaceAgent(BaseAgent):
         The preface should immediately grab attention and position regulatory affairs as a critical business advantage, not just compliance.
         """
 
-        state.preface, _ = self.llm.call_llm(prompt)
+        state.preface, _ = self._call_llm(prompt, book=state)
         return state
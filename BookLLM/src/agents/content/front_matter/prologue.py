@@ -25,5 +25,5 @@ class PrologueAgent(BaseAgent):
         Length: 400-600 words.
         """
 
-        state.prologue, _ = self.llm.call_llm(prompt)
+        state.prologue, _ = self._call_llm(prompt)
         return state
@@ -1,10 +1,22 @@
-import re
+from typing import Dict, List
 
 from ....models.agent_type import AgentType
 from ....models.state import BookState
 from ...base import BaseAgent
 
 
+class _SlugTable(dict):
+    """``str.translate`` table mapping everything except ``a-z0-9`` to ``-``"""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        self[codepoint] = char if "a" <= char <= "z" or "0" <= char <= "9" else "-"
+        return self[codepoint]
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 class TableOfContentsAgent(BaseAgent):
     """Generates structured table of contents"""
 
@@ -14,8 +26,17 @@ class TableOfContentsAgent(BaseAgent):
     @staticmethod
     def _slugify(text: str) -> str:
         """Simplistic slugify helper for generating markdown anchors"""
-        slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
-        return slug
+        slug = text.lower().translate(_SLUG_TABLE)
+        return "-".join(part for part in slug.split("-") if part)
+
+    @classmethod
+    def chapter_anchors(cls, chapters: List[str]) -> Dict[str, str]:
+        """Map each chapter title to the anchor of its ``Chapter N: title`` heading"""
+        anchors: Dict[str, str] = {}
+        for i, chapter in enumerate(chapters, 1):
+            if chapter not in anchors:
+                anchors[chapter] = cls._slugify(f"chapter-{i}-{chapter}")
+        return anchors
 
     def _execute_logic(self, state: BookState) -> BookState:
         """Generate comprehensive table of contents"""
@@ -46,9 +67,9 @@ class TableOfContentsAgent(BaseAgent):
         # Main Content
         if state.chapters:
             toc.append("\n## Contents")
+            anchors = self.chapter_anchors(state.chapters)
             for i, chapter in enumerate(state.chapters, 1):
-                anchor = self._slugify(f"chapter-{i}-{chapter}")
-                toc.append(f"{i}. [{chapter}](#{anchor})")
+                toc.append(f"{i}. [{chapter}](#{anchors[chapter]})")
                 if chapter in state.chapter_summaries:
                     summary = state.chapter_summaries[chapter].split(".")[0]
                     toc.append(f"   _{summary}_\n")
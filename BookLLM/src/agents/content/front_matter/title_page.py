@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from ....models.agent_type import AgentType
@@ -22,7 +23,11 @@ class TitlePageAgent(BaseAgent):
         output_dir = Path(self.llm.system_config.output_dir)
         tex_path = output_dir / "title.tex"
         try:
-            tex_path.write_text(maketitle)
+            # Incremental runs usually regenerate the same title page
+            if not tex_path.exists() or tex_path.read_text() != maketitle:
+                tmp_path = tex_path.with_suffix(".tex.tmp")
+                tmp_path.write_text(maketitle)
+                os.replace(tmp_path, tex_path)
         except Exception as e:
             self.logger.warning(f"Failed to write title.tex: {e}")
 
@@ -5,6 +5,11 @@ from ...models.agent_type import AgentType
 from ...models.state import BookState
 from ..base import BaseAgent
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\n(.*?)```", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"({.*})", re.DOTALL)
+# Common keys used for chapter titles
+_TITLE_KEYS = ("title", "Title", "chapter_title", "Chapter Title", "name")
+
 
 class OutlineAgent(BaseAgent):
     """Generates book outline and chapter structure"""
@@ -71,14 +76,7 @@ class OutlineAgent(BaseAgent):
                 continue
 
             if isinstance(item, dict):
-                # Common keys used for chapter titles
-                for key in [
-                    "title",
-                    "Title",
-                    "chapter_title",
-                    "Chapter Title",
-                    "name",
-                ]:
+                for key in _TITLE_KEYS:
                     if key in item and isinstance(item[key], str):
                         processed_list.append(item[key])
                         break
@@ -94,10 +92,10 @@ class OutlineAgent(BaseAgent):
 
     def _extract_json_block(self, response: str) -> Optional[str]:
         """Attempt to extract a JSON block from an LLM response."""
-        code_block = re.search(r"```(?:json)?\n(.*?)```", response, re.DOTALL)
+        code_block = _JSON_FENCE_RE.search(response)
         if code_block:
             return code_block.group(1)
-        match = re.search(r"({.*})", response, re.DOTALL)
+        match = _JSON_OBJECT_RE.search(response)
         return match.group(1) if match else None
 
     def _fallback_parsing(self, response: str) -> List[str]:
@@ -0,0 +1,51 @@
+import asyncio
+import copy
+from typing import Mapping
+
+from ...models.state import BookState
+from ..base import BaseAgent
+
+
+async def agenerate_sections(
+    agents: Mapping[str, BaseAgent], state: BookState
+) -> BookState:
+    """Run independent front- or back-matter agents concurrently.
+
+    ``agents`` maps the ``BookState`` attribute each agent fills to the agent.
+    Every agent runs ``aprocess`` (with its usual retries) on its own copy of
+    ``state``. The copy has its own ``metadata`` (a deep copy) and its own
+    step, error and warning lists; the remaining fields are shared and only
+    read. Once all have finished, the generated sections, the ``metadata``
+    entries each agent added or changed, completed steps, errors and warnings
+    are merged back in agent order.
+    """
+    original = copy.deepcopy(state.metadata)
+    results = await asyncio.gather(
+        *(
+            agent.aprocess(
+                state.model_copy(
+                    update={
+                        "metadata": copy.deepcopy(original),
+                        "completed_steps": [],
+                        "errors": [],
+                        "warnings": [],
+                    }
+                )
+            )
+            for agent in agents.values()
+        )
+    )
+
+    for attr, result in zip(agents, results):
+        setattr(state, attr, getattr(result, attr))
+        # Skip unchanged entries so one agent cannot undo another's update.
+        state.metadata.update(
+            (key, value)
+            for key, value in result.metadata.items()
+            if key not in original or original[key] != value
+        )
+        state.completed_steps.extend(result.completed_steps)
+        state.errors.extend(result.errors)
+        state.warnings.extend(result.warnings)
+
+    return state
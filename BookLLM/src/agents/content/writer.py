@@ -5,15 +5,19 @@ from typing import Optional, Type
 
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils import run_async
 from ..base import BaseAgent
 from .chapter import ChapterWriterAgent
 from .outline import OutlineAgent
 from .front_matter.book_title import BookTitleAgent
+from .sections import agenerate_sections
+
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase names to snake_case."""
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    return _CAMEL_BOUNDARY_RE.sub("_", name).lower()
 
 
 class WriterAgent(BaseAgent):
@@ -47,13 +51,17 @@ class WriterAgent(BaseAgent):
             "PrologueAgent": "prologue",
         }
 
+        pending = {}
         for agent_name, attr in front_matter_agents.items():
             if getattr(state, attr, None):
                 continue  # Skip if already generated
             agent_class = self._get_agent_class(agent_name)
             if agent_class:
-                agent = agent_class(self.llm, self.agent_type)
-                state = agent.process(state)
+                pending[attr] = agent_class(self.llm, self.agent_type)
+
+        # Each agent fills its own section, so their LLM calls run concurrently
+        if pending:
+            state = run_async(agenerate_sections(pending, state))
 
         # Generate main content
         chapter_writer = ChapterWriterAgent(self.llm, self.agent_type)
@@ -76,31 +84,37 @@ class WriterAgent(BaseAgent):
             "IndexAgent": "index_terms",
         }
 
+        pending = {}
         for agent_name, attr in back_matter_agents.items():
             if getattr(state, attr, None):
                 continue
-            agent_class = self._get_back_agent_class(agent_name)
+            agent_class = self._get_agent_class(agent_name, "back_matter")
             if agent_class:
-                agent = agent_class(self.llm, self.agent_type)
-                state = agent.process(state)
+                pending[attr] = agent_class(self.llm, self.agent_type)
 
-                if agent_name == "IndexAgent":
-                    try:
-                        from ..enhancement.index_sanitizer import IndexSanitizerAgent
+        # The sections are independent, so their LLM calls run concurrently
+        if pending:
+            state = run_async(agenerate_sections(pending, state))
 
-                        sanitizer = IndexSanitizerAgent(self.llm, self.agent_type)
-                        state = sanitizer.process(state)
-                    except Exception as e:
-                        self.logger.warning(f"Index sanitization failed: {e}")
+        if "index_terms" in pending:
+            try:
+                from ..enhancement.index_sanitizer import IndexSanitizerAgent
+
+                sanitizer = IndexSanitizerAgent(self.llm, self.agent_type)
+                state = sanitizer.process(state)
+            except Exception as e:
+                self.logger.warning(f"Index sanitization failed: {e}")
 
         state.generation_completed = datetime.now()
         return state
 
-    def _get_agent_class(self, agent_name: str) -> Optional[Type[BaseAgent]]:
-        """Get agent class by name"""
+    def _get_agent_class(
+        self, agent_name: str, package: str = "front_matter"
+    ) -> Optional[Type[BaseAgent]]:
+        """Get a front or back matter agent class by name"""
         try:
-            # Import front matter agents dynamically using the package path of
-            # this module. When executed with ``python -m BookLLM.src.main`` the
+            # Import the agents dynamically using the package path of this
+            # module. When executed with ``python -m BookLLM.src.main`` the
             # project is namespaced under ``BookLLM`` so there is no top-level
             # ``src`` package. ``__package__`` resolves to ``BookLLM.src.agents.content``
             # which ensures the dynamic import works regardless of how the
@@ -110,22 +124,7 @@ class WriterAgent(BaseAgent):
                 if agent_name.lower().endswith("agent")
                 else agent_name
             )
-            module_name = f"{__package__}.front_matter.{_camel_to_snake(module_base)}"
-            module = importlib.import_module(module_name)
-            return getattr(module, agent_name)
-        except (ImportError, AttributeError) as e:
-            self.logger.warning(f"Failed to load agent {agent_name}: {e}")
-            return None
-
-    def _get_back_agent_class(self, agent_name: str) -> Optional[Type[BaseAgent]]:
-        """Load back matter agent by name"""
-        try:
-            module_base = (
-                agent_name.removesuffix("Agent")
-                if agent_name.lower().endswith("agent")
-                else agent_name
-            )
-            module_name = f"{__package__}.back_matter.{_camel_to_snake(module_base)}"
+            module_name = f"{__package__}.{package}.{_camel_to_snake(module_base)}"
             module = importlib.import_module(module_name)
             return getattr(module, agent_name)
         except (ImportError, AttributeError) as e:
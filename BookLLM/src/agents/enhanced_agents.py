@@ -4,6 +4,8 @@ Integrates advanced prompting, domain expertise, and quality controls
 """
 
 import asyncio
+import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -15,77 +17,133 @@ from ..quality.advanced_quality import ProfessionalQualityOrchestrator
 from ..utils.logger import get_logger
 from ..ui.realtime_integration import AgentUIIntegration, integrate_status_with_state, integrate_quality_metrics
 
+logger = get_logger(__name__)
+
+# Smallest score gain that justifies another refinement iteration
+MIN_QUALITY_IMPROVEMENT = 0.01
+
+# Checked in order; the first domain with a keyword in the topic wins
+_DOMAIN_KEYWORDS = (
+    ('machine learning', ('machine learning', 'ml', 'artificial intelligence', 'ai', 'neural', 'deep learning')),
+    ('software engineering', ('software', 'programming', 'development', 'engineering', 'coding', 'architecture')),
+    ('data science', ('data science', 'analytics', 'statistics', 'data analysis', 'big data')),
+    ('cybersecurity', ('security', 'cybersecurity', 'hacking', 'penetration', 'encryption')),
+    ('cloud computing', ('cloud', 'aws', 'azure', 'gcp', 'kubernetes', 'docker')),
+    ('blockchain', ('blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'smart contracts')),
+)
+
+# Outline lines that name a chapter: "Chapter 3: Title", "Chapter 3 - Title",
+# "## Title" or "3. Title"; numbered subsections such as "3.1 Detail" are not
+_CHAPTER_LINE_RE = re.compile(
+    r'^[ \t]*(?:Chapter\b[ \t]*\d*[ \t]*[.:\-]?|#+|\d+\.(?!\d))[ \t]*(.*?)[ \t]*$', re.MULTILINE
+)
+
+# Template sections whose presence is recorded in chapter metadata
+_SECTION_MARKER_RE = re.compile(r'example|case study|key takeaways|glossary', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _classify_domain(topic: str) -> str:
+    """Map a topic to its domain, memoized across refinement iterations"""
+    topic_lower = topic.lower()
+    for domain, keywords in _DOMAIN_KEYWORDS:
+        if any(keyword in topic_lower for keyword in keywords):
+            return domain
+    return 'general_technology'
+
+
+# Expert agents share one of each subsystem, along with its warm caches
+@lru_cache(maxsize=None)
+def _prompt_engine() -> AdvancedPromptEngine:
+    return AdvancedPromptEngine()
+
+
+@lru_cache(maxsize=None)
+def _domain_expert() -> DomainExpertSystem:
+    return DomainExpertSystem()
+
+
+@lru_cache(maxsize=None)
+def _quality_orchestrator() -> ProfessionalQualityOrchestrator:
+    return ProfessionalQualityOrchestrator()
+
+
 class ExpertContentGenerator(AgentUIIntegration, BaseAgent):
     """Expert-level content generator with domain specialization"""
     
     def __init__(self, llm, agent_type, max_iterations=3):
         super().__init__(llm, agent_type)
-        self.prompt_engine = AdvancedPromptEngine()
-        self.domain_expert = DomainExpertSystem()
-        self.quality_orchestrator = ProfessionalQualityOrchestrator()
+        self.prompt_engine = _prompt_engine()
+        self.domain_expert = _domain_expert()
+        self.quality_orchestrator = _quality_orchestrator()
         self.max_iterations = max_iterations
-        self.logger = get_logger(__name__)
     
     async def generate_expert_content(self, state: BookState, context: Dict[str, Any]) -> str:
         """Generate expert-level content with iterative refinement"""
         
         topic = state.topic
         domain = self._extract_domain(topic)
+        best_score, best_content = float('-inf'), ""
+        
+        # Reference material only depends on the topic, so fetch it while the
+        # first draft is being generated
+        prewarm = asyncio.ensure_future(self.domain_expert.prewarm(topic, domain))
         
-        for iteration in range(self.max_iterations):
-            self.logger.info(f"Generating content iteration {iteration + 1}/{self.max_iterations}")
+        try:
+            for iteration in range(self.max_iterations):
+                logger.info(f"Generating content iteration {iteration + 1}/{self.max_iterations}")
             
-            # Generate enhanced prompt
-            expert_prompt = self.prompt_engine.create_expert_prompt(
-                agent_type=self.agent_type.value,
-                topic=topic,
-                context=context
-            )
+                # Generate enhanced prompt
+                expert_prompt = self.prompt_engine.create_expert_prompt(
+                    agent_type=self.agent_type.value,
+                    topic=topic,
+                    context=context
+                )
             
-            # Generate initial content
-            content, _ = await self.llm.acall_llm(expert_prompt)
+                # Generate initial content
+                content, _ = await self.llm.acall_llm(expert_prompt)
             
-            # Enhance with domain expertise
-            enhanced_content = await self.domain_expert.enhance_content_with_expertise(
-                content, topic, domain
-            )
+                await prewarm  # Usually finished by the time the draft arrives
             
-            # Quality assessment
-            quality_metrics = await self.quality_orchestrator.comprehensive_quality_assessment(
-                state  # Pass full state for context
-            )
+                # Enhance with domain expertise and assess quality concurrently;
+                # the assessment reads the full state, not this draft
+                enhanced_content, quality_metrics = await asyncio.gather(
+                    self.domain_expert.enhance_content_with_expertise(
+                        content, topic, domain
+                    ),
+                    self.quality_orchestrator.comprehensive_quality_assessment(
+                        state  # Pass full state for context
+                    ),
+                )
             
-            # Check if quality threshold met
-            if quality_metrics.overall_score > 0.85:
-                self.logger.info(f"Quality threshold met on iteration {iteration + 1}")
-                return enhanced_content
+                # Check if quality threshold met
+                if quality_metrics.overall_score > 0.85:
+                    logger.info(f"Quality threshold met on iteration {iteration + 1}")
+                    return enhanced_content
             
-            # Prepare context for next iteration with feedback
-            context['previous_content'] = content
-            context['quality_feedback'] = self._generate_quality_feedback(quality_metrics)
-            context['iteration'] = iteration + 1
-        
-        self.logger.info(f"Reached max iterations, returning best content")
-        return enhanced_content
+                # Stop refining once an iteration no longer improves the score
+                improvement = quality_metrics.overall_score - best_score
+                if improvement > 0:
+                    best_score, best_content = quality_metrics.overall_score, enhanced_content
+                if iteration > 0 and improvement < MIN_QUALITY_IMPROVEMENT:
+                    logger.info(f"Quality stopped improving on iteration {iteration + 1}")
+                    return best_content
+            
+                # Prepare context for next iteration with feedback
+                context['previous_content'] = content
+                context['quality_feedback'] = self._generate_quality_feedback(quality_metrics)
+                context['iteration'] = iteration + 1
+        finally:
+            # A failed draft must not leave the retrieval running unobserved
+            prewarm.cancel()
+            await asyncio.gather(prewarm, return_exceptions=True)
+        
+        logger.info(f"Reached max iterations, returning best content")
+        return best_content
     
     def _extract_domain(self, topic: str) -> str:
         """Extract domain from topic for specialized handling"""
-        topic_lower = topic.lower()
-        
-        domain_keywords = {
-            'machine learning': ['machine learning', 'ml', 'artificial intelligence', 'ai', 'neural', 'deep learning'],
-            'software engineering': ['software', 'programming', 'development', 'engineering', 'coding', 'architecture'],
-            'data science': ['data science', 'analytics', 'statistics', 'data analysis', 'big data'],
-            'cybersecurity': ['security', 'cybersecurity', 'hacking', 'penetration', 'encryption'],
-            'cloud computing': ['cloud', 'aws', 'azure', 'gcp', 'kubernetes', 'docker'],
-            'blockchain': ['blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'smart contracts']
-        }
-        
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in topic_lower for keyword in keywords):
-                return domain
-        
-        return 'general_technology'
+        return _classify_domain(topic)
     
     def _generate_quality_feedback(self, quality_metrics) -> str:
         """Generate specific feedback for content improvement"""
@@ -124,7 +182,7 @@ class ExpertOutlineAgent(ExpertContentGenerator):
         outline_content = await self.generate_expert_content(state, context)
         
         # Parse outline into structured format
-        chapters = self._parse_outline_to_chapters(outline_content)
+        chapters = self._parse_outline_to_chapters(outline_content, state)
         
         # Validate outline pedagogical structure
         validated_chapters = self._validate_pedagogical_structure(chapters, state.target_audience)
@@ -169,28 +227,16 @@ class ExpertOutlineAgent(ExpertContentGenerator):
         
         return objectives_by_audience.get(state.target_audience, objectives_by_audience['intermediate'])
     
-    def _parse_outline_to_chapters(self, outline_content: str) -> List[str]:
+    def _parse_outline_to_chapters(self, outline_content: str, state: BookState) -> List[str]:
         """Parse generated outline into structured chapter list"""
         
-        lines = outline_content.split('\n')
+        # One pass over the outline; the pattern strips the chapter marker
+        # and numbering, leaving any "Part:" style prefix for the split below
         chapters = []
-        
-        for line in lines:
-            line = line.strip()
-            # Look for chapter indicators
-            if (line.startswith('Chapter') or 
-                line.startswith('#') or
-                (line and line[0].isdigit() and '.' in line[:5])):
-                
-                # Clean up chapter title
-                chapter_title = line
-                # Remove chapter numbering
-                chapter_title = chapter_title.replace('Chapter', '').strip()
-                chapter_title = chapter_title.lstrip('#').strip()
-                chapter_title = chapter_title.split(':', 1)[-1].strip() if ':' in chapter_title else chapter_title
-                
-                if chapter_title and len(chapter_title) > 3:
-                    chapters.append(chapter_title)
+        for match in _CHAPTER_LINE_RE.finditer(outline_content):
+            chapter_title = match.group(1).split(':', 1)[-1].strip()
+            if len(chapter_title) > 3:
+                chapters.append(chapter_title)
         
         # Ensure minimum chapters based on book length
         min_chapters = max(5, state.estimated_pages // 20)
@@ -205,24 +251,27 @@ class ExpertOutlineAgent(ExpertContentGenerator):
         # Ensure proper learning progression
         structured_chapters = []
         
+        # Lowercase the titles once; no keyword spans the newline separator
+        titles = "\n".join(chapters).lower()
+        
         # Always start with fundamentals
-        if not any('introduction' in ch.lower() or 'fundamental' in ch.lower() for ch in chapters):
+        if 'introduction' not in titles and 'fundamental' not in titles:
             structured_chapters.append(f"Introduction to {chapters[0] if chapters else 'Core Concepts'}")
         
         # Add original chapters
         structured_chapters.extend(chapters)
         
         # Ensure practical application
-        if not any('practical' in ch.lower() or 'application' in ch.lower() or 'project' in ch.lower() for ch in chapters):
+        if not any(keyword in titles for keyword in ('practical', 'application', 'project')):
             structured_chapters.append("Practical Applications and Case Studies")
         
         # Ensure advanced topics for intermediate/advanced audiences
         if audience in ['intermediate', 'advanced']:
-            if not any('advanced' in ch.lower() or 'optimization' in ch.lower() for ch in chapters):
+            if 'advanced' not in titles and 'optimization' not in titles:
                 structured_chapters.append("Advanced Techniques and Optimization")
         
         # Always end with future directions
-        if not any('future' in ch.lower() or 'conclusion' in ch.lower() for ch in chapters):
+        if 'future' not in titles and 'conclusion' not in titles:
             structured_chapters.append("Future Directions and Conclusion")
         
         return structured_chapters
@@ -234,41 +283,60 @@ class ExpertChapterAgent(ExpertContentGenerator):
     async def process(self, state: BookState) -> BookState:
         """Generate expert-level chapter content using unified template"""
         
-        for chapter_title in state.chapters:
-            if chapter_title in state.chapter_map:
-                continue  # Skip already generated chapters
-            
-            self.logger.info(f"Generating expert content for chapter: {chapter_title}")
-            
-            context = {
-                'task': f'Write comprehensive chapter content for "{chapter_title}" using unified template structure',
-                'chapter_title': chapter_title,
-                'target_audience': state.target_audience,
-                'book_style': state.book_style,
-                'previous_chapters': list(state.chapter_map.keys()),
-                'learning_objectives': self._get_chapter_objectives(chapter_title, state),
-                'word_target': 3500,  # Professional chapter length
-                'template_requirements': self._get_unified_template_prompt()
-            }
-            
-            # Generate expert chapter content with unified template
-            chapter_content = await self.generate_expert_content(state, context)
-            
+        missing = [
+            (index, title) for index, title in enumerate(state.chapters)
+            if title not in state.chapter_map  # Skip already generated chapters
+        ]
+        
+        # Chapters are independent LLM round trips, so generate them
+        # concurrently, bounded by the configured worker count
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+        
+        async def generate(index: int, chapter_title: str) -> str:
+            async with semaphore:
+                logger.info(f"Generating expert content for chapter: {chapter_title}")
+                
+                context = {
+                    'task': f'Write comprehensive chapter content for "{chapter_title}" using unified template structure',
+                    'chapter_title': chapter_title,
+                    'target_audience': state.target_audience,
+                    'book_style': state.book_style,
+                    'previous_chapters': state.chapters[:index],
+                    'learning_objectives': self._get_chapter_objectives(chapter_title, state),
+                    'word_target': 3500,  # Professional chapter length
+                    'template_requirements': self._get_unified_template_prompt()
+                }
+                
+                # Generate expert chapter content with unified template
+                return await self.generate_expert_content(state, context)
+        
+        # A failed chapter must not discard the ones that finished
+        contents = await asyncio.gather(
+            *(generate(i, t) for i, t in missing), return_exceptions=True
+        )
+        
+        # Track generation metadata
+        chapter_metadata = state.metadata.setdefault("chapter_metadata", {})
+        
+        for (_, chapter_title), chapter_content in zip(missing, contents):
+            if isinstance(chapter_content, Exception):
+                error_msg = f"Failed to write chapter '{chapter_title}': {chapter_content}"
+                logger.error(error_msg)
+                state.errors.append(error_msg)
+                continue
             state.chapter_map[chapter_title] = chapter_content
             
-            # Track generation metadata
-            if "chapter_metadata" not in state.metadata:
-                state.metadata["chapter_metadata"] = {}
-            
-            state.metadata["chapter_metadata"][chapter_title] = {
+            # One case-insensitive pass finds every section marker
+            sections = {match.group().lower() for match in _SECTION_MARKER_RE.finditer(chapter_content)}
+            chapter_metadata[chapter_title] = {
                 "word_count": len(chapter_content.split()),
                 "generation_time": datetime.now().isoformat(),
                 "quality_level": "expert",
                 "template_structure": "unified",
-                "includes_examples": "example" in chapter_content.lower(),
-                "includes_case_study": "case study" in chapter_content.lower(),
-                "includes_takeaways": "key takeaways" in chapter_content.lower(),
-                "includes_glossary": "glossary" in chapter_content.lower()
+                "includes_examples": "example" in sections,
+                "includes_case_study": "case study" in sections,
+                "includes_takeaways": "key takeaways" in sections,
+                "includes_glossary": "glossary" in sections
             }
         
         state.current_step = "chapter_generation"
@@ -341,13 +409,12 @@ class QualityEnhancedOrchestrator:
     
     def __init__(self, base_orchestrator):
         self.base_orchestrator = base_orchestrator
-        self.quality_system = ProfessionalQualityOrchestrator()
-        self.logger = get_logger(__name__)
+        self.quality_system = _quality_orchestrator()
     
     async def generate_professional_book(self, topic: str, **kwargs) -> Dict[str, Any]:
         """Generate book with world-class quality controls"""
         
-        self.logger.info(f"Starting professional book generation for: {topic}")
+        logger.info(f"Starting professional book generation for: {topic}")
         
         # Replace standard agents with expert agents
         self._enhance_orchestrator_agents()
@@ -386,4 +453,4 @@ class QualityEnhancedOrchestrator:
                 self.base_orchestrator.agents['chapter'].agent_type
             )
         
-        self.logger.info("Enhanced orchestrator with expert agents")
\ No newline at end of file
+        logger.info("Enhanced orchestrator with expert agents")
\ No newline at end of file
@@ -1,7 +1,18 @@
+import asyncio
+
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils import run_async
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
+CASE_STUDY_TEMPLATE = """Write a practical case study demonstrating the key ideas from the chapter described at the end of this prompt.
+Provide a concise scenario (200-300 words)."""
+
+# Every chapter's prompt starts with the template and book inputs, so the
+# provider can reuse the cached prefix across the whole batch
+CASE_STUDY_TEMPLATE_KEY = source_hash(CASE_STUDY_TEMPLATE)
+
 
 class CaseStudyAgent(BaseAgent):
     """Generate short case studies for each chapter."""
@@ -10,26 +21,58 @@ class CaseStudyAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
+        if self.llm.system_config.parallel_agents:
+            return run_async(self._aexecute_logic(state))
         for chapter_title, content in state.chapter_map.items():
             try:
                 self._generate_case_study(state, chapter_title, content)
             except Exception as e:
-                self.logger.error(
-                    f"Failed to generate case study for {chapter_title}: {e}"
-                )
-                state.warnings.append(
-                    f"Case study generation failed for {chapter_title}"
+                self._record_case_study_failure(state, chapter_title, e)
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Generate all case studies concurrently, up to ``max_workers`` at once"""
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+
+        async def generate(chapter_title: str, content: str) -> str:
+            async with semaphore:
+                prompt = self._build_prompt(state, chapter_title, content)
+                response, _ = await self.llm.acall_llm(
+                    prompt, cache_key=CASE_STUDY_TEMPLATE_KEY
                 )
+            return response
+
+        chapters = list(state.chapter_map.items())
+        results = await asyncio.gather(
+            *(generate(title, content) for title, content in chapters),
+            return_exceptions=True,
+        )
+        for (chapter_title, _), result in zip(chapters, results):
+            if isinstance(result, Exception):
+                self._record_case_study_failure(state, chapter_title, result)
+            else:
+                state.case_studies[chapter_title] = result.strip()
         return state
 
+    def _record_case_study_failure(
+        self, state: BookState, chapter_title: str, error: Exception
+    ) -> None:
+        self.logger.error(f"Failed to generate case study for {chapter_title}: {error}")
+        state.warnings.append(f"Case study generation failed for {chapter_title}")
+
     def _generate_case_study(
         self, state: BookState, chapter_title: str, content: str
     ) -> None:
-        prompt = f"""
-        Write a practical case study demonstrating the key ideas from chapter "{chapter_title}" of a book on {state.topic}.
-        Audience: {state.target_audience}.
-        Provide a concise scenario (200-300 words).
-        Content preview: {content[:1000]}...
-        """
-        response, _ = self.llm.call_llm(prompt)
+        prompt = self._build_prompt(state, chapter_title, content)
+        response, _ = self.llm.call_llm(prompt, cache_key=CASE_STUDY_TEMPLATE_KEY)
         state.case_studies[chapter_title] = response.strip()
+
+    def _build_prompt(self, state: BookState, chapter_title: str, content: str) -> str:
+        return (
+            f"{CASE_STUDY_TEMPLATE}\n\n"
+            f'Book inputs:\n- Book topic: "{state.topic}"\n'
+            f"- Audience: {state.target_audience}\n"
+            "---\nChapter-specific inputs:\n"
+            f'- Chapter title: "{chapter_title}"\n'
+            f"- Content preview: {content[:1000]}..."
+        )
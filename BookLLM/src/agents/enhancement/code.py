@@ -1,7 +1,44 @@
+import asyncio
+import re
+
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils import run_async
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
+_TECHNICAL_INDICATORS = (
+    "code",
+    "programming",
+    "implementation",
+    "function",
+    "class",
+    "algorithm",
+    "example",
+    "demonstration",
+    "snippet",
+)
+# One case-insensitive scan instead of lowercasing the chapter per indicator
+_TECHNICAL_INDICATOR_RE = re.compile(
+    "|".join(map(re.escape, _TECHNICAL_INDICATORS)), re.IGNORECASE
+)
+
+CODE_SAMPLE_TEMPLATE = """Create practical code examples for the chapter described at the end of this prompt.
+
+Requirements:
+1. Include setup/installation if needed
+2. Add detailed comments explaining each part
+3. Follow best practices
+4. Show practical use cases
+5. Include error handling
+6. Add usage examples
+
+Return response as valid Python code with markdown formatting.
+Use ```python blocks for code sections."""
+
+# Shared prefix identifier, used as a provider prompt-cache key
+CODE_SAMPLE_TEMPLATE_KEY = source_hash(CODE_SAMPLE_TEMPLATE)
+
 
 class CodeSampleAgent(BaseAgent):
     """Generate and enhance code samples"""
@@ -10,59 +47,77 @@ class CodeSampleAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
+        if self.llm.system_config.parallel_agents:
+            return run_async(self._aexecute_logic(state))
         for chapter_title, content in state.chapter_map.items():
             if self._needs_code_samples(content):
                 self._generate_chapter_code_samples(state, chapter_title, content)
         return state
 
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Generate code samples for all chapters concurrently"""
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+
+        async def generate(chapter_title: str, content: str) -> str:
+            async with semaphore:
+                prompt = self._build_prompt(state, chapter_title, content)
+                code_sample, _ = await self.llm.acall_llm(
+                    prompt, cache_key=CODE_SAMPLE_TEMPLATE_KEY
+                )
+            return code_sample
+
+        chapters = [
+            (title, content)
+            for title, content in state.chapter_map.items()
+            if self._needs_code_samples(content)
+        ]
+        results = await asyncio.gather(
+            *(generate(title, content) for title, content in chapters),
+            return_exceptions=True,
+        )
+        for (chapter_title, _), result in zip(chapters, results):
+            if isinstance(result, Exception):
+                self._record_code_sample_failure(state, chapter_title, result)
+            else:
+                state.code_samples[chapter_title] = self._post_process_code(result)
+                self.logger.info(f"Generated code samples for {chapter_title}")
+        return state
+
     def _needs_code_samples(self, content: str) -> bool:
         """Check if content would benefit from code samples"""
-        technical_indicators = [
-            "code",
-            "programming",
-            "implementation",
-            "function",
-            "class",
-            "algorithm",
-            "example",
-            "demonstration",
-            "snippet",
-        ]
-        return any(indicator in content.lower() for indicator in technical_indicators)
+        return _TECHNICAL_INDICATOR_RE.search(content) is not None
 
     def _generate_chapter_code_samples(
         self, state: BookState, chapter_title: str, content: str
     ):
         """Generate code samples for a specific chapter"""
-        prompt = f"""
-        Create practical code examples for chapter "{chapter_title}".
-        
-        Context:
-        - Topic: {state.topic}
-        - Audience: {state.target_audience}
-        - Chapter content: {content[:1000]}...
-        
-        Requirements:
-        1. Include setup/installation if needed
-        2. Add detailed comments explaining each part
-        3. Follow best practices
-        4. Show practical use cases
-        5. Include error handling
-        6. Add usage examples
-        
-        Return response as valid Python code with markdown formatting.
-        Use ```python blocks for code sections.
-        """
-
+        prompt = self._build_prompt(state, chapter_title, content)
         try:
-            code_sample, _ = self.llm.call_llm(prompt)
+            code_sample, _ = self.llm.call_llm(
+                prompt, cache_key=CODE_SAMPLE_TEMPLATE_KEY
+            )
             state.code_samples[chapter_title] = self._post_process_code(code_sample)
             self.logger.info(f"Generated code samples for {chapter_title}")
         except Exception as e:
-            self.logger.error(
-                f"Failed to generate code sample for {chapter_title}: {e}"
-            )
-            state.errors.append(f"Code sample generation failed for {chapter_title}")
+            self._record_code_sample_failure(state, chapter_title, e)
+
+    def _record_code_sample_failure(
+        self, state: BookState, chapter_title: str, error: Exception
+    ) -> None:
+        self.logger.error(
+            f"Failed to generate code sample for {chapter_title}: {error}"
+        )
+        state.errors.append(f"Code sample generation failed for {chapter_title}")
+
+    def _build_prompt(self, state: BookState, chapter_title: str, content: str) -> str:
+        return (
+            f"{CODE_SAMPLE_TEMPLATE}\n\n"
+            f'Book inputs:\n- Topic: "{state.topic}"\n'
+            f"- Audience: {state.target_audience}\n"
+            "---\nChapter-specific inputs:\n"
+            f'- Chapter title: "{chapter_title}"\n'
+            f"- Chapter content: {content[:1000]}..."
+        )
 
     def _post_process_code(self, code: str) -> str:
         """Clean and format code samples"""
@@ -1,8 +1,25 @@
+from itertools import islice
+from typing import Iterable
+
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
 
+def _content_preview(chapters: Iterable[str], limit: int) -> str:
+    """First ``limit`` characters of the chapters joined by blank lines"""
+    parts, size = [], 0
+    for content in chapters:
+        # Copy only the part of each chapter that can still fit
+        part = content[: limit - size]
+        parts.append(part)
+        size += len(part) + 2
+        if size >= limit:
+            break
+    return "\n\n".join(parts)[:limit]
+
+
 class GlossaryAgent(BaseAgent):
     """Generate comprehensive glossary terms and definitions"""
 
@@ -10,11 +27,11 @@ class GlossaryAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
-        all_content = "\n\n".join(state.chapter_map.values())
+        preview = _content_preview(state.chapter_map.values(), 2000)
 
         prompt = f"""
         Extract and define technical terms from this {state.topic} content.
-        Content preview: {all_content[:2000]}...
+        Content preview: {preview}...
         
         Generate JSON with:
         - Key: technical term
@@ -22,6 +39,10 @@ class GlossaryAgent(BaseAgent):
         Focus on {state.target_audience} comprehension level.
         Include common industry terms and concepts.
         """
+        # Re-runs over unchanged chapters would ask the same question again
+        previous = state.metadata.get("glossary_source_hash")
+        if state.glossary and previous == source_hash(prompt):
+            return state
 
         try:
             response, _ = self.llm.call_llm(prompt, json_mode=True)
@@ -56,6 +77,7 @@ class GlossaryAgent(BaseAgent):
                 raise ValueError("Invalid glossary format")
 
             state.glossary = glossary
+            state.metadata["glossary_source_hash"] = source_hash(prompt)
             self.logger.info(f"Generated glossary with {len(state.glossary)} terms")
         except Exception as e:
             self.logger.warning(f"Glossary generation failed: {e}")
@@ -69,6 +91,7 @@ class GlossaryAgent(BaseAgent):
                         fallback[term] = definition
             if fallback:
                 state.glossary = fallback
+                state.metadata["glossary_source_hash"] = source_hash(prompt)
                 self.logger.info(
                     f"Fallback glossary parsed with {len(state.glossary)} terms"
                 )
@@ -84,21 +107,25 @@ class AcronymAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
-        content_sample = "\n\n".join(list(state.chapter_map.values())[:3])
+        content_sample = _content_preview(islice(state.chapter_map.values(), 3), 1500)
 
         prompt = f"""
         Extract acronyms and abbreviations from:
-        {content_sample[:1500]}...
+        {content_sample}...
         
         Return JSON:
         - Key: acronym/abbreviation
         - Value: full expansion
         Include standard {state.topic} terminology.
         """
+        previous = state.metadata.get("acronyms_source_hash")
+        if state.acronyms and previous == source_hash(prompt):
+            return state
 
         try:
             response, _ = self.llm.call_llm(prompt, json_mode=True)
             state.acronyms = self._parse_json(response)
+            state.metadata["acronyms_source_hash"] = source_hash(prompt)
             self.logger.info(f"Extracted {len(state.acronyms)} acronyms")
         except Exception as e:
             self.logger.warning(f"Acronym extraction failed: {e}")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Set
+from typing import Dict, List, Set
 
 from ...models.agent_type import AgentType
 from ...models.state import BookState
@@ -15,18 +15,38 @@ class GlossaryLinker(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
+        terms: Dict[str, str] = {}
+        for term in state.glossary.keys():
+            terms.setdefault(term.lower(), term)
+        if not terms:
+            return state
+
+        # One alternation of every term (longest first, so the longest term
+        # at a position wins) scans each chapter once instead of once per term
+        alternation = "|".join(
+            re.escape(term) for term in sorted(terms.values(), key=len, reverse=True)
+        )
+        pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
         linked: Set[str] = set()
+        relinked: Dict[str, str] = {}
         for chapter, content in state.chapter_map.items():
-            for term in state.glossary.keys():
-                lower = term.lower()
-                if lower in linked:
+            if len(linked) == len(terms):
+                break
+            parts: List[str] = []
+            last = 0
+            for match in pattern.finditer(content):
+                lower = match.group().lower()
+                if lower in linked or lower not in terms:
                     continue
-                pattern = re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
-                if pattern.search(content):
-                    label = lower.replace(" ", "-")
-                    link = f"[{term}](#glossary-{label})"
-                    content = pattern.sub(link, content, count=1)
-                    linked.add(lower)
-            state.chapter_map[chapter] = content
+                term = terms[lower]
+                label = lower.replace(" ", "-")
+                parts.append(content[last : match.start()])
+                parts.append(f"[{term}](#glossary-{label})")
+                last = match.end()
+                linked.add(lower)
+            if parts:
+                parts.append(content[last:])
+                relinked[chapter] = "".join(parts)
+        state.chapter_map.update(relinked)
         return state
-
@@ -30,5 +30,5 @@ class IndexSanitizerAgent(BaseAgent):
             seen.add(slug)
             cleaned.append(term.strip())
 
-        state.index_terms = sorted(cleaned, key=lambda s: s.lower())
+        state.index_terms = sorted(cleaned, key=str.lower)
         return state
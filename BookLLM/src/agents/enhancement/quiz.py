@@ -1,7 +1,22 @@
+import asyncio
+import json
+from typing import List
+
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils import run_async
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
+# Token budget for each chapter excerpt in a prompt
+EXCERPT_TOKENS = 256
+
+QUIZ_TEMPLATE = """Generate 3-5 short 'Check Your Understanding' questions based on the chapter described at the end of this prompt.
+Return the questions as a JSON list of strings."""
+
+# Shared prefix identifier, used as a provider prompt-cache key
+QUIZ_TEMPLATE_KEY = source_hash(QUIZ_TEMPLATE)
+
 
 class QuizAgent(BaseAgent):
     """Create 'Check Your Understanding' questions for each chapter."""
@@ -10,26 +25,134 @@ class QuizAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
-        for chapter_title, content in state.chapter_map.items():
+        if not state.chapter_map:
+            return state
+        if self.llm.system_config.parallel_agents:
+            return run_async(self._aexecute_logic(state))
+        try:
+            response, _ = self.llm.call_llm(
+                self._build_batch_prompt(state), json_mode=True
+            )
+            missing = self._store_batch(state, response)
+        except Exception as e:
+            self.logger.warning(f"Batched question generation failed: {e}")
+            missing = list(state.chapter_map)
+        for chapter_title in missing:
+            content = state.chapter_map[chapter_title]
             try:
                 self._generate_questions(state, chapter_title, content)
             except Exception as e:
-                self.logger.error(
-                    f"Failed to generate questions for {chapter_title}: {e}"
-                )
-                state.warnings.append(f"Question generation failed for {chapter_title}")
+                self._record_question_failure(state, chapter_title, e)
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Ask for every chapter in one call, then fan out for any it missed"""
+        if not state.chapter_map:
+            return state
+        try:
+            response, _ = await self.llm.acall_llm(
+                self._build_batch_prompt(state), json_mode=True
+            )
+            missing = self._store_batch(state, response)
+        except Exception as e:
+            self.logger.warning(f"Batched question generation failed: {e}")
+            missing = list(state.chapter_map)
+
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+        stream = getattr(self.llm.system_config, "stream_chapters", False)
+
+        async def generate(chapter_title: str, content: str) -> str:
+            async with semaphore:
+                prompt = self._build_prompt(state, chapter_title, content)
+                if stream:
+                    response = await self._astream_llm(
+                        prompt,
+                        chapter_title,
+                        json_mode=True,
+                        cache_key=QUIZ_TEMPLATE_KEY,
+                    )
+                else:
+                    response, _ = await self.llm.acall_llm(
+                        prompt, json_mode=True, cache_key=QUIZ_TEMPLATE_KEY
+                    )
+            return response
+
+        chapters = [(title, state.chapter_map[title]) for title in missing]
+        results = await asyncio.gather(
+            *(generate(title, content) for title, content in chapters),
+            return_exceptions=True,
+        )
+        for (chapter_title, _), result in zip(chapters, results):
+            if isinstance(result, Exception):
+                self._record_question_failure(state, chapter_title, result)
+                continue
+            try:
+                self._store_questions(state, chapter_title, result)
+            except Exception as e:
+                self._record_question_failure(state, chapter_title, e)
         return state
 
+    def _record_question_failure(
+        self, state: BookState, chapter_title: str, error: Exception
+    ) -> None:
+        self.logger.error(f"Failed to generate questions for {chapter_title}: {error}")
+        state.warnings.append(f"Question generation failed for {chapter_title}")
+
     def _generate_questions(
         self, state: BookState, chapter_title: str, content: str
     ) -> None:
-        prompt = f"""
-        Generate 3-5 short 'Check Your Understanding' questions based on chapter "{chapter_title}" about {state.topic}.
+        prompt = self._build_prompt(state, chapter_title, content)
+        response, _ = self.llm.call_llm(
+            prompt, json_mode=True, cache_key=QUIZ_TEMPLATE_KEY
+        )
+        self._store_questions(state, chapter_title, response)
+
+    def _build_prompt(self, state: BookState, chapter_title: str, content: str) -> str:
+        return (
+            f"{QUIZ_TEMPLATE}\n\n"
+            f'Book inputs:\n- Book topic: "{state.topic}"\n'
+            f"- Audience: {state.target_audience}\n"
+            "---\nChapter-specific inputs:\n"
+            f'- Chapter title: "{chapter_title}"\n'
+            f"- Chapter excerpt: {self.llm.truncate_tokens(content, EXCERPT_TOKENS)}..."
+        )
+
+    def _build_batch_prompt(self, state: BookState) -> str:
+        excerpts = json.dumps(
+            {
+                title: self.llm.truncate_tokens(content, EXCERPT_TOKENS)
+                for title, content in state.chapter_map.items()
+            },
+            ensure_ascii=False,
+        )
+        return f"""
+        Generate 3-5 short 'Check Your Understanding' questions for each chapter of a book about {state.topic}.
         Audience: {state.target_audience}.
-        Return the questions as a JSON list of strings.
-        Chapter excerpt: {content[:1000]}...
+        Return JSON of the form {{"chapters": {{"<chapter title>": ["question", ...]}}}}
+        using the chapter titles exactly as given.
+        Chapter excerpts by title: {excerpts}
         """
-        response, _ = self.llm.call_llm(prompt, json_mode=True)
+
+    def _store_batch(self, state: BookState, response: str) -> List[str]:
+        """Store the batched questions; return the chapters still missing"""
+        data = self._parse_json(response)
+        chapters = data.get("chapters") if isinstance(data, dict) else None
+        if not isinstance(chapters, dict):
+            raise ValueError("Invalid batched question format")
+        missing = []
+        for chapter_title in state.chapter_map:
+            questions = chapters.get(chapter_title)
+            if isinstance(questions, list) and questions:
+                state.check_questions[chapter_title] = [
+                    str(q).strip() for q in questions
+                ]
+            else:
+                missing.append(chapter_title)
+        return missing
+
+    def _store_questions(
+        self, state: BookState, chapter_title: str, response: str
+    ) -> None:
         questions = self._parse_json(response)
         if isinstance(questions, list):
             state.check_questions[chapter_title] = [str(q).strip() for q in questions]
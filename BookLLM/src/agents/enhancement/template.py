@@ -1,7 +1,20 @@
+import asyncio
+
 from ...models.agent_type import AgentType
 from ...models.state import BookState
+from ...utils import run_async
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
+# Token budget for the chapter excerpt in a prompt
+EXCERPT_TOKENS = 256
+
+WORKSHEET_TEMPLATE = """Create a short downloadable worksheet or template that complements the chapter described at the end of this prompt.
+Provide the template in Markdown format."""
+
+# Shared prefix identifier, used as a provider prompt-cache key
+WORKSHEET_TEMPLATE_KEY = source_hash(WORKSHEET_TEMPLATE)
+
 
 class TemplateAgent(BaseAgent):
     """Generate simple downloadable templates for each chapter."""
@@ -10,23 +23,63 @@ class TemplateAgent(BaseAgent):
         super().__init__(llm, agent_type)
 
     def _execute_logic(self, state: BookState) -> BookState:
+        if self.llm.system_config.parallel_agents:
+            return run_async(self._aexecute_logic(state))
         for chapter_title, content in state.chapter_map.items():
             try:
                 self._generate_template(state, chapter_title, content)
             except Exception as e:
-                self.logger.error(
-                    f"Failed to generate template for {chapter_title}: {e}"
-                )
-                state.warnings.append(f"Template generation failed for {chapter_title}")
+                self._record_template_failure(state, chapter_title, e)
         return state
 
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Generate all templates concurrently, up to ``max_workers`` at once"""
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+        stream = getattr(self.llm.system_config, "stream_chapters", False)
+
+        async def generate(chapter_title: str, content: str) -> str:
+            async with semaphore:
+                prompt = self._build_prompt(state, chapter_title, content)
+                if stream:
+                    response = await self._astream_llm(
+                        prompt, chapter_title, cache_key=WORKSHEET_TEMPLATE_KEY
+                    )
+                else:
+                    response, _ = await self.llm.acall_llm(
+                        prompt, cache_key=WORKSHEET_TEMPLATE_KEY
+                    )
+            return response
+
+        chapters = list(state.chapter_map.items())
+        results = await asyncio.gather(
+            *(generate(title, content) for title, content in chapters),
+            return_exceptions=True,
+        )
+        for (chapter_title, _), result in zip(chapters, results):
+            if isinstance(result, Exception):
+                self._record_template_failure(state, chapter_title, result)
+            else:
+                state.templates[chapter_title] = result.strip()
+        return state
+
+    def _record_template_failure(
+        self, state: BookState, chapter_title: str, error: Exception
+    ) -> None:
+        self.logger.error(f"Failed to generate template for {chapter_title}: {error}")
+        state.warnings.append(f"Template generation failed for {chapter_title}")
+
     def _generate_template(
         self, state: BookState, chapter_title: str, content: str
     ) -> None:
-        prompt = f"""
-        Create a short downloadable worksheet or template that complements chapter "{chapter_title}" of a book on {state.topic}.
-        Provide the template in Markdown format.
-        Chapter excerpt: {content[:1000]}...
-        """
-        response, _ = self.llm.call_llm(prompt)
+        prompt = self._build_prompt(state, chapter_title, content)
+        response, _ = self.llm.call_llm(prompt, cache_key=WORKSHEET_TEMPLATE_KEY)
         state.templates[chapter_title] = response.strip()
+
+    def _build_prompt(self, state: BookState, chapter_title: str, content: str) -> str:
+        return (
+            f"{WORKSHEET_TEMPLATE}\n\n"
+            f'Book inputs:\n- Book topic: "{state.topic}"\n'
+            "---\nChapter-specific inputs:\n"
+            f'- Chapter title: "{chapter_title}"\n'
+            f"- Chapter excerpt: {self.llm.truncate_tokens(content, EXCERPT_TOKENS)}..."
+        )
@@ -1,68 +1,123 @@
+import asyncio
+import re
+from functools import lru_cache
 from typing import Dict, List
 
 from ...models.state import BookState
+from ...utils import run_async
+from ...utils.llm_cache import source_hash
 from ..base import BaseAgent
 
+# Token budget for the chapter text sent for proofreading
+PROOFREAD_TOKENS = 512
+
+PROOFREAD_TEMPLATE = """Proofread and improve the chapter content at the end of this prompt.
+
+Check for:
+1. Grammar and spelling
+2. Punctuation and formatting
+3. Technical term consistency
+4. Sentence structure and flow
+5. Style consistency with the book style
+6. Audience appropriateness for the target audience
+
+Return the corrected version maintaining technical accuracy."""
+
+# Shared prefix identifier, used as a provider prompt-cache key
+PROOFREAD_TEMPLATE_KEY = source_hash(PROOFREAD_TEMPLATE)
+
+
+@lru_cache(maxsize=512)
+def _term_pattern(term: str) -> re.Pattern:
+    return re.compile(term, re.IGNORECASE)
+
 
 class ProofreaderAgent(BaseAgent):
     """Enhanced proofreading agent for content refinement"""
 
     def _execute_logic(self, state: BookState) -> BookState:
         """Detailed proofreading and corrections"""
-        for chapter_title, content in state.chapter_map.items():
+        if self.llm.system_config.parallel_agents:
+            return run_async(self._aexecute_logic(state))
+        corrected: Dict[str, str] = {}
+        for chapter_title, content in list(state.chapter_map.items()):
             try:
-                corrected_content = self._proofread_chapter(
+                corrected[chapter_title] = self._proofread_chapter(
                     chapter_title, content, state
                 )
-                state.chapter_map[chapter_title] = corrected_content
             except Exception as e:
                 self.logger.warning(f"Proofreading failed for {chapter_title}: {e}")
 
+        state.chapter_map.update(corrected)
+        return state
+
+    async def _aexecute_logic(self, state: BookState) -> BookState:
+        """Proofread all chapters concurrently, up to ``max_workers`` at once"""
+        semaphore = asyncio.Semaphore(max(1, self.llm.system_config.max_workers))
+        stream = getattr(self.llm.system_config, "stream_chapters", False)
+
+        async def proofread(chapter_title: str, content: str) -> str:
+            async with semaphore:
+                prompt = self._build_prompt(content, state)
+                if stream:
+                    corrected_content = await self._astream_llm(
+                        prompt, chapter_title, cache_key=PROOFREAD_TEMPLATE_KEY
+                    )
+                else:
+                    corrected_content, _ = await self.llm.acall_llm(
+                        prompt, cache_key=PROOFREAD_TEMPLATE_KEY
+                    )
+            return corrected_content
+
+        chapters = list(state.chapter_map.items())
+        results = await asyncio.gather(
+            *(proofread(title, content) for title, content in chapters),
+            return_exceptions=True,
+        )
+        # Chapters are replaced only once every call has finished
+        corrected: Dict[str, str] = {}
+        for (chapter_title, _), result in zip(chapters, results):
+            if isinstance(result, Exception):
+                self.logger.warning(
+                    f"Proofreading failed for {chapter_title}: {result}"
+                )
+            else:
+                corrected[chapter_title] = result
+        state.chapter_map.update(corrected)
         return state
 
     def _proofread_chapter(self, title: str, content: str, state: BookState) -> str:
         """Proofread individual chapter content"""
-        prompt = f"""
-        Proofread and improve this chapter content.
-        
-        Check for:
-        1. Grammar and spelling
-        2. Punctuation and formatting
-        3. Technical term consistency
-        4. Sentence structure and flow
-        5. Style consistency ({state.book_style})
-        6. Audience appropriateness ({state.target_audience})
-        
-        Content to proofread:
-        {content[:2000]}...
-        
-        Return the corrected version maintaining technical accuracy.
-        """
-
-        corrected_content, _ = self.llm.call_llm(prompt)
+        corrected_content, _ = self.llm.call_llm(
+            self._build_prompt(content, state), cache_key=PROOFREAD_TEMPLATE_KEY
+        )
         return corrected_content
 
+    def _build_prompt(self, content: str, state: BookState) -> str:
+        return (
+            f"{PROOFREAD_TEMPLATE}\n\n"
+            f"Book inputs:\n- Book style: {state.book_style}\n"
+            f"- Target audience: {state.target_audience}\n"
+            "---\nContent to proofread:\n"
+            f"{self.llm.truncate_tokens(content, PROOFREAD_TOKENS)}..."
+        )
+
     def _check_technical_terms(
         self, content: str, glossary: Dict[str, str]
     ) -> List[str]:
         """Verify technical term usage consistency"""
         issues = []
-        for term, definition in glossary.items():
-            if term.lower() in content.lower():
-                # Check for consistent usage
-                term_count = content.lower().count(term.lower())
-                if term_count > 1:
-                    # Verify consistent capitalization and formatting
-                    variations = self._find_term_variations(content, term)
-                    if len(variations) > 1:
-                        issues.append(
-                            f"Inconsistent usage of term '{term}': {variations}"
-                        )
+        # Lowercase the chapter once rather than up to twice per term
+        content_lower = content.lower()
+        for term in glossary:
+            # Only terms used more than once can be used inconsistently
+            if content_lower.count(term.lower()) > 1:
+                # Verify consistent capitalization and formatting
+                variations = self._find_term_variations(content, term)
+                if len(variations) > 1:
+                    issues.append(f"Inconsistent usage of term '{term}': {variations}")
         return issues
 
     def _find_term_variations(self, content: str, term: str) -> List[str]:
         """Find variations of term usage in content"""
-        import re
-
-        pattern = re.compile(f"{term}", re.IGNORECASE)
-        return list(set(pattern.findall(content)))
+        return list(set(_term_pattern(term).findall(content)))
@@ -6,6 +6,17 @@ from typing import Dict, List
 
 from textstat import textstat
 
+_PASSIVE_RE = re.compile(
+    r"\b(?:was|were|is|are|been|be|being)\s+\w+(?:ed|en)\b", flags=re.IGNORECASE
+)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Words of 12+ letters; the length filter runs inside the regex engine
+_JARGON_RE = re.compile(r"[A-Za-z']{12,}")
+
+
+def _term_re(term: str) -> re.Pattern:
+    return re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
+
 
 @dataclass
 class ConsistencyReport:
@@ -20,6 +31,10 @@ class ReadabilityConsistencyChecker:
 
     def __init__(self, terminology_map: Dict[str, str] | None = None) -> None:
         self.terminology_map = terminology_map or {}
+        self._terminology_res = [
+            (short, canonical, _term_re(short), _term_re(canonical))
+            for short, canonical in self.terminology_map.items()
+        ]
 
     def check_readability(self, text: str) -> Dict[str, float]:
         """Return common readability scores."""
@@ -30,25 +45,17 @@ class ReadabilityConsistencyChecker:
 
     def detect_passive_voice(self, text: str) -> List[str]:
         """Detect sentences that appear to use passive voice."""
-        passive_re = re.compile(
-            r"\b(?:was|were|is|are|been|be|being)\s+\w+(?:ed|en)\b",
-            flags=re.IGNORECASE,
-        )
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [s for s in sentences if passive_re.search(s)]
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        return [s for s in sentences if _PASSIVE_RE.search(s)]
 
     def detect_jargon(self, text: str) -> List[str]:
         """Flag uncommon long words as potential jargon."""
-        words = re.findall(r"[A-Za-z']+", text)
-        jargon_words = {w for w in words if len(w) >= 12}
-        return sorted(jargon_words, key=str.lower)
+        return sorted(set(_JARGON_RE.findall(text)), key=str.lower)
 
     def enforce_terminology(self, text: str) -> List[str]:
         """Return terminology inconsistencies based on the provided map."""
         issues = []
-        for short, canonical in self.terminology_map.items():
-            short_re = re.compile(rf"\b{re.escape(short)}\b", re.IGNORECASE)
-            canonical_re = re.compile(rf"\b{re.escape(canonical)}\b", re.IGNORECASE)
+        for short, canonical, short_re, canonical_re in self._terminology_res:
             if short_re.search(text) and canonical_re.search(text):
                 issues.append(f"Use either '{short}' or '{canonical}', not both")
         return issues
@@ -6,6 +6,8 @@ from typing import List
 
 from textstat import textstat
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class TuneResult:
@@ -24,17 +26,13 @@ class ReadabilityTuner:
     def tune(self, text: str) -> TuneResult:
         grade = textstat.flesch_kincaid_grade(text)
         suggestions: List[str] = []
-
-        if grade > self.threshold:
-            sentences = re.split(r"(?<=[.!?])\s+", text)
-            for sentence in sentences:
-                words = sentence.split()
-                if len(words) > 25:
-                    snippet = (
-                        " ".join(words[:10]) + "..." if len(words) > 10 else sentence
-                    )
-                    suggestions.append(
-                        f"Consider splitting sentence starting: '{snippet}'"
-                    )
+        if grade <= self.threshold:
+            return TuneResult(grade=grade, suggestions=suggestions)
+
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            words = sentence.split()
+            if len(words) > 25:
+                snippet = " ".join(words[:10]) + "..." if len(words) > 10 else sentence
+                suggestions.append(f"Consider splitting sentence starting: '{snippet}'")
 
         return TuneResult(grade=grade, suggestions=suggestions)
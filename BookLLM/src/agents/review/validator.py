@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Callable, Dict, List
 
 from ...models.state import BookState
 from ...utils.logger import get_logger
@@ -19,34 +20,46 @@ class ContentValidator:
         }
 
     async def validate(self, state: BookState) -> List[Dict[str, Any]]:
-        """Run all validation checks"""
-        results = []
+        """Run all validation checks concurrently; results keep check order"""
         total_checks = len(self.validators)
-
-        for i, (name, validator) in enumerate(self.validators.items(), 1):
-            try:
-                state.current_step = f"validation_{name}"
+        completed = 0
+
+        async def run(name: str, validator: Callable) -> Dict[str, Any]:
+            nonlocal completed
+            result = await self._run_one(name, validator, state)
+            completed += 1
+            # Update progress
+            if "error" not in result and hasattr(state, "progress_tracker"):
+                progress = completed / total_checks
+                state.progress_tracker.update(f"validate_{name}", progress, state)
+            return result
+
+        return list(
+            await asyncio.gather(
+                *(run(name, validator) for name, validator in self.validators.items())
+            )
+        )
+
+    async def _run_one(
+        self, name: str, validator: Callable, state: BookState
+    ) -> Dict[str, Any]:
+        """Run one check; CPU-bound (sync) checks run in a worker thread"""
+        try:
+            state.current_step = f"validation_{name}"
+            if asyncio.iscoroutinefunction(validator):
                 result = await validator(state)
-                results.append(
-                    {
-                        "check": name,
-                        "passed": result["passed"],
-                        "score": result.get("score"),
-                        "issues": result.get("issues", []),
-                        "recommendations": result.get("recommendations", []),
-                    }
-                )
-
-                # Update progress
-                if hasattr(state, "progress_tracker"):
-                    progress = i / total_checks
-                    state.progress_tracker.update(f"validate_{name}", progress, state)
-
-            except Exception as e:
-                self.logger.error(f"Validation '{name}' failed: {e}")
-                results.append({"check": name, "passed": False, "error": str(e)})
-
-        return results
+            else:
+                result = await asyncio.to_thread(validator, state)
+            return {
+                "check": name,
+                "passed": result["passed"],
+                "score": result.get("score"),
+                "issues": result.get("issues", []),
+                "recommendations": result.get("recommendations", []),
+            }
+        except Exception as e:
+            self.logger.error(f"Validation '{name}' failed: {e}")
+            return {"check": name, "passed": False, "error": str(e)}
 
     async def _check_plagiarism(self, state: BookState) -> Dict[str, Any]:
         """Check content for potential plagiarism"""
@@ -59,11 +72,16 @@ class ContentValidator:
             "recommendations": ["Consider using a dedicated plagiarism checker"],
         }
 
-    async def _check_readability(self, state: BookState) -> Dict[str, Any]:
+    def _check_readability(self, state: BookState) -> Dict[str, Any]:
         """Check content readability levels"""
         from textstat import textstat
 
-        scores = {}
+        # Scored in this thread: textstat caches results in-process, and the
+        # quality agents have usually scored these same chapters already
+        scores = {
+            chapter: textstat.flesch_reading_ease(content)
+            for chapter, content in state.chapter_map.items()
+        }
         issues = []
 
         target_scores = {
@@ -72,10 +90,7 @@ class ContentValidator:
             "advanced": {"min": 30, "max": 50},
         }
 
-        for chapter, content in state.chapter_map.items():
-            score = textstat.flesch_reading_ease(content)
-            scores[chapter] = score
-
+        for chapter, score in scores.items():
             target = target_scores.get(state.target_audience, {"min": 50, "max": 70})
             if not (target["min"] <= score <= target["max"]):
                 issues.append(
@@ -93,7 +108,7 @@ class ContentValidator:
             ),
         }
 
-    async def _check_consistency(self, state: BookState) -> Dict[str, Any]:
+    def _check_consistency(self, state: BookState) -> Dict[str, Any]:
         """Verify terminology and style consistency"""
         issues = []
         terms = {}
@@ -1,5 +1,8 @@
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-import json
+from queue import Empty
+import orjson
 import yaml
 from flask import Flask, jsonify, request, Response, send_from_directory, send_file
 from flask_cors import CORS
@@ -10,7 +13,7 @@ from typing import Dict, Type
 from .core import BookOrchestrator
 from .utils.metrics import TokenMetricsTracker
 from .agents.base import BaseAgent
-from .monitoring import status_updates, agent_start_times
+from .monitoring import agent_start_times, subscribe_status, unsubscribe_status
 
 app = Flask(__name__, static_folder=None)  # Disable built-in static folder
 CORS(app)
@@ -18,6 +21,18 @@ CORS(app)
 # Default config path within the package
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
 
+# libyaml's loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> dict:
+    """Parse ``CONFIG_PATH`` once per process; treat the result as read-only"""
+    if not CONFIG_PATH.exists():
+        return {}
+    with open(CONFIG_PATH) as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 def _discover_agents() -> Dict[str, Type[BaseAgent]]:
     """Dynamically discover available agent classes."""
@@ -45,12 +60,9 @@ AGENT_REGISTRY = _discover_agents()
 
 
 # Path for the metrics file determined from configuration
+@lru_cache(maxsize=1)
 def _metrics_file_path() -> Path:
-    config = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            config = yaml.safe_load(f) or {}
-    output_dir = config.get("system", {}).get("output_dir", "./book_output")
+    output_dir = _load_config().get("system", {}).get("output_dir", "./book_output")
     return Path(output_dir) / "final_token_metrics.json"
 
 
@@ -61,12 +73,8 @@ def generate_book():
     if not topic:
         return jsonify({"error": "'topic' field required"}), 400
 
-    config = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            config = yaml.safe_load(f) or {}
-
-    orchestrator = BookOrchestrator(config)
+    # The orchestrator may adjust its config; keep the cached copy pristine
+    orchestrator = BookOrchestrator(deepcopy(_load_config()))
     orchestrator.generate_book(topic=topic)
     return jsonify({"message": "Book generation completed"})
 
@@ -78,8 +86,7 @@ def get_metrics():
     if not metrics_file.exists():
         return jsonify({"error": "metrics not found"}), 404
 
-    with open(metrics_file) as f:
-        data = json.load(f)
+    data = orjson.loads(metrics_file.read_bytes())
 
     tracker = TokenMetricsTracker()
     tracker.metrics = data
@@ -126,14 +133,32 @@ def health():
     return jsonify({"status": "ok"})
 
 
+# Seconds without an update before a keep-alive comment is sent; a failed
+# write is how a disconnected client is noticed and unsubscribed
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
 @app.route("/events/agent-status")
 def agent_status_events():
-    def generate():
-        while True:
-            payload = status_updates.get()
-            yield f"data: {json.dumps(payload)}\n\n"
+    queue = subscribe_status()
 
-    return Response(generate(), mimetype="text/event-stream")
+    def generate():
+        try:
+            while True:
+                try:
+                    payload = queue.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except Empty:
+                    yield b": keep-alive\n\n"
+                    continue
+                yield b"data: " + orjson.dumps(payload) + b"\n\n"
+        finally:
+            unsubscribe_status(queue)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # Frontend serving routes - ORDER MATTERS! Static files must come before catch-all
@@ -4,20 +4,45 @@ Extends the existing API with WebSocket support and enhanced status endpoints
 """
 
 import asyncio
-import json
 import threading
 import time
 from datetime import datetime
-from typing import Dict, Any, List
+from queue import Empty
+from typing import Dict, Any, List, Optional, Tuple
 
+import orjson
+import xxhash
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 from .ui.orchestrator_integration import create_ui_integrated_book_generator, UIHealthChecker
 from .ui.realtime_integration import status_manager
 from .utils.logger import get_logger
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize JSON responses with orjson instead of the stdlib encoder"""
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumpb(obj).decode()
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Encode ``obj`` straight to UTF-8 bytes"""
+        return orjson.dumps(obj, default=self.default, option=self.option)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj), mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 logger = get_logger(__name__)
 
@@ -25,6 +50,43 @@ logger = get_logger(__name__)
 ui_orchestrator = None
 health_checker = None
 
+# Status snapshots are shared by every endpoint and SSE client for this long
+STATUS_TTL_SECONDS = 0.5
+
+
+class _StatusCache:
+    """Short-lived orchestrator status snapshot plus the responses built from it"""
+
+    def __init__(self, ttl: float = STATUS_TTL_SECONDS):
+        self.ttl = ttl
+        self.expires_at = 0.0
+        self.raw_status: Dict[str, Any] = {}
+        self.encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+        """Return the current status and its encoded responses by endpoint"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self.expires_at:
+                self.raw_status = ui_orchestrator.get_current_status()
+                # A fresh dict, so responses built from an older snapshot
+                # never land in the new one
+                self.encoded = {}
+                self.expires_at = now + self.ttl
+            return self.raw_status, self.encoded
+
+    def invalidate(self, update: Dict[str, Any] = None):
+        """Drop the snapshot; registered as a status listener"""
+        self.expires_at = 0.0
+
+
+_status_cache = _StatusCache()
+
+
+def _json_response(encoded: bytes) -> Response:
+    return Response(encoded, mimetype='application/json')
+
 
 @app.before_first_request
 def initialize_orchestrator():
@@ -34,6 +96,7 @@ def initialize_orchestrator():
     try:
         ui_orchestrator = create_ui_integrated_book_generator()
         health_checker = UIHealthChecker(ui_orchestrator)
+        ui_orchestrator.add_status_listener(_status_cache.invalidate)
         logger.info("UI-integrated orchestrator initialized")
     except Exception as e:
         logger.error(f"Failed to initialize orchestrator: {e}")
@@ -48,12 +111,14 @@ def get_enhanced_status():
         if not ui_orchestrator:
             return jsonify({'error': 'Orchestrator not initialized'}), 500
         
-        status = ui_orchestrator.get_current_status()
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
-            'status': status,
-            'health': health_checker.get_system_health() if health_checker else None
-        })
+        status, encoded = _status_cache.get()
+        if 'enhanced-status' not in encoded:
+            encoded['enhanced-status'] = app.json.dumpb({
+                'timestamp': datetime.now().isoformat(),
+                'status': status,
+                'health': health_checker.get_system_health() if health_checker else None
+            })
+        return _json_response(encoded['enhanced-status'])
         
     except Exception as e:
         logger.error(f"Enhanced status error: {e}")
@@ -67,29 +132,43 @@ def get_detailed_agent_status():
         if not ui_orchestrator:
             return jsonify({'error': 'Orchestrator not initialized'}), 500
         
-        status = ui_orchestrator.get_current_status()
+        status, encoded = _status_cache.get()
+        if 'agents-detailed' in encoded:
+            return _json_response(encoded['agents-detailed'])
+
         agents = status.get('agents', {})
         
-        # Enhance agent data with additional details
+        # Enhance agent data with additional details, tallying the summary
+        # in the same pass
         enhanced_agents = {}
+        counts = {'running': 0, 'completed': 0, 'failed': 0}
+        quality_sum = 0.0
         for agent_name, agent_data in agents.items():
+            performance = _calculate_agent_performance(agent_data)
             enhanced_agents[agent_name] = {
                 **agent_data,
-                'performance_score': _calculate_agent_performance(agent_data),
-                'efficiency_rating': _calculate_efficiency_rating(agent_data),
+                'performance_score': performance,
+                'efficiency_rating': _calculate_efficiency_rating(agent_data, performance),
                 'estimated_completion': _estimate_completion_time(agent_data)
             }
-        
-        return jsonify({
+            # Status is an AgentStatus member or its string value
+            agent_status = agent_data.get('status')
+            agent_status = getattr(agent_status, 'value', agent_status)
+            if agent_status in counts:
+                counts[agent_status] += 1
+            quality_sum += agent_data.get('quality_score', 0)
+        
+        encoded['agents-detailed'] = app.json.dumpb({
             'agents': enhanced_agents,
             'summary': {
                 'total_agents': len(enhanced_agents),
-                'running_agents': len([a for a in enhanced_agents.values() if a.get('status') == 'running']),
-                'completed_agents': len([a for a in enhanced_agents.values() if a.get('status') == 'completed']),
-                'failed_agents': len([a for a in enhanced_agents.values() if a.get('status') == 'failed']),
-                'average_quality': sum(a.get('quality_score', 0) for a in enhanced_agents.values()) / max(len(enhanced_agents), 1)
+                'running_agents': counts['running'],
+                'completed_agents': counts['completed'],
+                'failed_agents': counts['failed'],
+                'average_quality': quality_sum / max(len(enhanced_agents), 1)
             }
         })
+        return _json_response(encoded['agents-detailed'])
         
     except Exception as e:
         logger.error(f"Detailed agent status error: {e}")
@@ -103,7 +182,10 @@ def get_quality_metrics():
         if not ui_orchestrator:
             return jsonify({'error': 'Orchestrator not initialized'}), 500
         
-        status = ui_orchestrator.get_current_status()
+        status, encoded = _status_cache.get()
+        if 'quality-metrics' in encoded:
+            return _json_response(encoded['quality-metrics'])
+
         quality_metrics = status.get('quality_metrics')
         
         if not quality_metrics:
@@ -112,7 +194,7 @@ def get_quality_metrics():
         # Calculate additional metrics
         final_score = _calculate_final_score(quality_metrics)
         
-        return jsonify({
+        encoded['quality-metrics'] = app.json.dumpb({
             'current_metrics': quality_metrics,
             'calculated_scores': {
                 'final_score': final_score,
@@ -123,6 +205,7 @@ def get_quality_metrics():
             'progression': quality_metrics.get('progression', []),
             'timestamp': datetime.now().isoformat()
         })
+        return _json_response(encoded['quality-metrics'])
         
     except Exception as e:
         logger.error(f"Quality metrics error: {e}")
@@ -136,7 +219,10 @@ def get_workflow_progress():
         if not ui_orchestrator:
             return jsonify({'error': 'Orchestrator not initialized'}), 500
         
-        status = ui_orchestrator.get_current_status()
+        status, encoded = _status_cache.get()
+        if 'workflow-progress' in encoded:
+            return _json_response(encoded['workflow-progress'])
+
         workflow_progress = status.get('workflow_progress')
         
         if not workflow_progress:
@@ -146,7 +232,7 @@ def get_workflow_progress():
         progress_percentage = workflow_progress.get('overall_progress', 0)
         estimated_time = workflow_progress.get('estimated_time_remaining', 'Unknown')
         
-        return jsonify({
+        encoded['workflow-progress'] = app.json.dumpb({
             'progress': workflow_progress,
             'analytics': {
                 'completion_rate': f"{progress_percentage:.1f}%",
@@ -157,6 +243,7 @@ def get_workflow_progress():
             },
             'timestamp': datetime.now().isoformat()
         })
+        return _json_response(encoded['workflow-progress'])
         
     except Exception as e:
         logger.error(f"Workflow progress error: {e}")
@@ -217,31 +304,55 @@ def generate_book_enhanced():
 
 # Server-Sent Events for Real-time Updates
 
+# Idle SSE connections get a comment line this often so proxies keep them open
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
 @app.route('/events/enhanced-status')
 def enhanced_status_stream():
     """Server-sent events for enhanced status updates"""
     
     def event_stream():
-        """Generate server-sent events"""
-        last_update = None
-        
-        while True:
-            try:
+        """Generate server-sent events as the status manager reports changes"""
+        updates = status_manager.subscribe()
+        last_digest = None
+        pending = True  # Send the current status as soon as a client connects
+        
+        try:
+            while True:
+                if not pending:
+                    try:
+                        updates.get(timeout=SSE_KEEPALIVE_SECONDS)
+                    except Empty:
+                        yield b": keepalive\n\n"
+                        continue
+                # A burst of updates is sent as one snapshot
+                try:
+                    while True:
+                        updates.get_nowait()
+                except Empty:
+                    pending = False
+                
                 if ui_orchestrator:
-                    current_status = ui_orchestrator.get_current_status()
+                    current_status, encoded = _status_cache.get()
+                    if 'sse' not in encoded:
+                        # The timestamp changes on every refresh, so it is
+                        # left out of the change digest
+                        encoded['sse-digest'] = xxhash.xxh3_64_digest(
+                            app.json.dumpb({**current_status, 'timestamp': None})
+                        )
+                        encoded['sse'] = b"data: " + app.json.dumpb(current_status) + b"\n\n"
                     
                     # Only send updates when status changes
-                    if current_status != last_update:
-                        yield f"data: {json.dumps(current_status)}\n\n"
-                        last_update = current_status
+                    if encoded['sse-digest'] != last_digest:
+                        yield encoded['sse']
+                        last_digest = encoded['sse-digest']
                 
-                # Wait before next check
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"SSE stream error: {e}")
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                break
+        except Exception as e:
+            logger.error(f"SSE stream error: {e}")
+            yield b"data: " + app.json.dumpb({'error': str(e)}) + b"\n\n"
+        finally:
+            status_manager.unsubscribe(updates)
     
     return Response(
         event_stream(),
@@ -341,9 +452,12 @@ def _calculate_agent_performance(agent_data: Dict[str, Any]) -> float:
         return 0.0
 
 
-def _calculate_efficiency_rating(agent_data: Dict[str, Any]) -> str:
-    """Calculate efficiency rating"""
-    performance = _calculate_agent_performance(agent_data)
+def _calculate_efficiency_rating(
+    agent_data: Dict[str, Any], performance: Optional[float] = None
+) -> str:
+    """Calculate efficiency rating, reusing ``performance`` when already known"""
+    if performance is None:
+        performance = _calculate_agent_performance(agent_data)
     
     if performance >= 0.9:
         return 'Excellent'
@@ -1,27 +1,36 @@
 from __future__ import annotations
 
 import re
-from typing import Dict
+from typing import Dict, Set
 
 from ...core.base import BaseAgent
 from ...core.types import AgentInput, AgentOutput
 from ...utils import external_dictionary
 
+_ACRONYM_RE = re.compile(r"\b[A-Z]{2,6}\b")
+
 
 class AcronymAgent(BaseAgent):
     """Resolve acronyms and build a glossary."""
 
     def run(self, input: AgentInput) -> AgentOutput:
         """Expand acronyms on first use and append a glossary."""
-        tokens = set(re.findall(r"\b[A-Z]{2,6}\b", input.content))
-        glossary: Dict[str, str] = {}
+        tokens = set(_ACRONYM_RE.findall(input.content))
+        glossary: Dict[str, str] = external_dictionary.lookup_many(tokens)
         content = input.content
-        for token in tokens:
-            definition = external_dictionary.lookup(token)
-            glossary[token] = definition
-            pattern = re.compile(rf"\b{token}\b")
-            content = pattern.sub(f"{definition} ({token})", content, count=1)
         if glossary:
+            # One scan over the text expands the first use of every acronym
+            pattern = re.compile(rf"\b(?:{'|'.join(map(re.escape, glossary))})\b")
+            seen: Set[str] = set()
+
+            def expand(match: re.Match) -> str:
+                token = match.group()
+                if token in seen:
+                    return token
+                seen.add(token)
+                return f"{glossary[token]} ({token})"
+
+            content = pattern.sub(expand, content)
             glossary_section = "\n".join(
                 f"- **{tok}**: {defn}" for tok, defn in glossary.items()
             )
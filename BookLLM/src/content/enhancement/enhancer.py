@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from typing import Iterable, List, Tuple
 
 from ...core.base import BaseAgent
 from ...core.types import AgentInput, AgentOutput, EmbeddedElement, SectionMeta
 from ...utils import prompt_engine
 
 
+def _splice(text: str, insertions: Iterable[Tuple[int, str]]) -> str:
+    """Insert each ``(position, snippet)`` pair, in ascending order, with one join."""
+    parts: List[str] = []
+    last = 0
+    for pos, snippet in insertions:
+        parts.append(text[last:pos])
+        parts.append(snippet)
+        last = pos
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 class ContentEnhancementAgent(BaseAgent):
     """Insert questions and examples into content."""
 
@@ -27,11 +39,11 @@ class ContentEnhancementAgent(BaseAgent):
         text = input.content
         added: List[EmbeddedElement] = []
         outline = input.outline or []
+        questions: List[Tuple[int, str]] = []
         for section in sorted(outline, key=lambda s: s.end, reverse=True):
             section_text = text[section.start:section.end]
             question = prompt_engine.generate_question(section.heading, section_text)
-            insertion = f"\n\n> {question}\n"
-            text = text[: section.end] + insertion + text[section.end :]
+            questions.append((section.end, f"\n\n> {question}\n"))
             added.append(
                 EmbeddedElement(
                     element_type="question",
@@ -39,13 +51,17 @@ class ContentEnhancementAgent(BaseAgent):
                     position=section.end,
                 )
             )
+        # Splice every question in one pass; reversed keeps the order of
+        # questions sharing an ``end`` the same as inserting them one by one
+        text = _splice(text, reversed(questions))
+
         pattern = re.compile(r"^#+\s*Example:\s*(.*)$", re.MULTILINE)
+        examples: List[Tuple[int, str]] = []
         for match in pattern.finditer(text):
             topic = match.group(1)
             example = prompt_engine.generate_example(topic)
             pos = match.end()
-            insertion = f"\n\n{example}\n"
-            text = text[:pos] + insertion + text[pos:]
+            examples.append((pos, f"\n\n{example}\n"))
             added.append(
                 EmbeddedElement(
                     element_type="example",
@@ -53,6 +69,7 @@ class ContentEnhancementAgent(BaseAgent):
                     position=pos,
                 )
             )
+        text = _splice(text, examples)
         return AgentOutput(enhanced_content=text, added_elements=added)
 
     def process(self, state: "BookState") -> "BookState":
@@ -62,13 +79,16 @@ class ContentEnhancementAgent(BaseAgent):
         if not isinstance(state, BookState):
             return state
 
-        for chapter, content in state.chapter_map.items():
+        # Rewritten chapters are applied once, after the loop
+        enhanced = {}
+        for chapter, content in list(state.chapter_map.items()):
             output = self.run(AgentInput(content=content))
             if output.enhanced_content:
-                state.chapter_map[chapter] = output.enhanced_content
+                enhanced[chapter] = output.enhanced_content
             if output.added_elements:
                 state.metadata.setdefault("enhanced_elements", {})[chapter] = [
                     e.__dict__ for e in output.added_elements
                 ]
+        state.chapter_map.update(enhanced)
 
         return state
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import re
-import string
 from typing import Dict
 
 from ...core.base import BaseAgent
 from ...core.types import AgentInput, LabelOutput
+from ..front_matter.toc import slugify
+
+_HEADING_RE = re.compile(r"^(#{1,2})\s+(.*)$")
 
 
 class LabelGeneratorAgent(BaseAgent):
@@ -23,7 +25,7 @@ class LabelGeneratorAgent(BaseAgent):
         labels: Dict[str, str] = {}
 
         for line in lines:
-            m = re.match(r"^(#{1,2})\s+(.*)$", line)
+            m = _HEADING_RE.match(line)
             if m:
                 heading = m.group(2).strip()
                 slug = self._slugify(heading)
@@ -39,9 +41,5 @@ class LabelGeneratorAgent(BaseAgent):
         labeled_content = "\n".join(labeled_lines)
         return LabelOutput(labeled_content=labeled_content, labels=labels)
 
-    @staticmethod
-    def _slugify(text: str) -> str:
-        text = text.lower()
-        text = text.translate(str.maketrans("", "", string.punctuation))
-        slug = re.sub(r"\s+", "-", text).strip("-")
-        return slug
+    # Shared with the TOC builder so its links match these anchors
+    _slugify = staticmethod(slugify)
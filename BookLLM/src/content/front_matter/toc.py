@@ -6,6 +6,13 @@ from typing import List
 
 from ...core.base import BaseAgent
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(text: str) -> str:
+    """Lowercase ``text`` and join its ASCII alphanumeric runs with dashes."""
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
+
 
 @dataclass
 class LabelOutput:
@@ -27,6 +34,6 @@ class TOCBuilderAgent(BaseAgent):
     def run(self, inputs: List[LabelOutput]) -> TOCOutput:
         lines: List[str] = []
         for idx, item in enumerate(inputs, 1):
-            slug = re.sub(r"[^a-z0-9]+", "-", item.label.lower()).strip("-")
+            slug = slugify(item.label)
             lines.append(f"- [Chapter {idx} \u2013 {item.label}](#{slug})")
         return TOCOutput(toc_markdown="\n".join(lines))
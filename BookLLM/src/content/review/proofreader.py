@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from typing import Dict, List
 
 from ...core.base import BaseAgent
 from ...core.types import AgentInput, AgentOutput, Suggestion
 from ...utils import language_tools
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?]) +")
+
+
+def _apply_replacements(text: str, replacements: Dict[str, str]) -> str:
+    """Apply every ``original -> recommendation`` pair in one scan of ``text``."""
+    if len(replacements) <= 1:
+        for original, recommendation in replacements.items():
+            text = text.replace(original, recommendation)
+        return text
+    # Longest first, so a longer original wins where two overlap
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    )
+    return pattern.sub(lambda m: replacements[m.group()], text)
+
 
 class ReviewerAgent(BaseAgent):
     """Perform basic proofreading on the provided content."""
@@ -26,7 +41,7 @@ class ReviewerAgent(BaseAgent):
             ``corrected_text`` with simple fixes applied and a list of
             ``suggestions`` for the user.
         """
-        sentences = re.split(r"(?<=[.!?]) +", input.content)
+        sentences = _SENTENCE_SPLIT_RE.split(input.content)
         corrected_parts: List[str] = []
         suggestions: List[Suggestion] = []
         offset = 0
@@ -35,14 +50,13 @@ class ReviewerAgent(BaseAgent):
             grammar = language_tools.grammar_check(sentence)
             style = language_tools.enforce_style_rules(sentence)
             all_sug = spell + grammar + style
+            replacements: Dict[str, str] = {}
             for s in all_sug:
                 s.position += offset
-                suggestions.append(s)
-            corrected = sentence
-            for s in all_sug:
                 if s.recommendation:
-                    corrected = corrected.replace(s.original, s.recommendation)
-            corrected_parts.append(corrected)
+                    replacements.setdefault(s.original, s.recommendation)
+            suggestions.extend(all_sug)
+            corrected_parts.append(_apply_replacements(sentence, replacements))
             offset += len(sentence) + 1
         corrected_text = " ".join(corrected_parts)
         return AgentOutput(corrected_text=corrected_text, suggestions=suggestions)
@@ -54,13 +68,15 @@ class ReviewerAgent(BaseAgent):
         if not isinstance(state, BookState):
             return state
 
-        for chapter, content in state.chapter_map.items():
+        corrected = {}
+        for chapter, content in list(state.chapter_map.items()):
             output = self.run(AgentInput(content=content, metadata={"chapter": chapter}))
             if output.corrected_text:
-                state.chapter_map[chapter] = output.corrected_text
+                corrected[chapter] = output.corrected_text
             if output.suggestions:
                 state.metadata.setdefault("review_suggestions", {})[chapter] = [
                     s.__dict__ for s in output.suggestions
                 ]
 
+        state.chapter_map.update(corrected)
         return state
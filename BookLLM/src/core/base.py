@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from .types import AgentInput, AgentOutput, Config
 
 
@@ -20,7 +20,7 @@ from ..content.enhancement.enhancer import ContentEnhancementAgent
 from ..content.enhancement.acronym import AcronymAgent
 from ..content.review.validator import QualityAssuranceAgent
 from .orchestrator import FinalCompilationAgent
-from .types import Config, AgentInput
+from .types import AgentInput, get_config
 
 
 class BookGraph:
@@ -65,7 +65,7 @@ class BookGraph:
 
     def _initialize_agents(self) -> Dict[str, Any]:
         """Initialize all required agents for the simplified pipeline."""
-        cfg = Config()
+        cfg = get_config()
         all_agents = {
             "outline": OutlineAgent(self.llm, AgentType.CONTENT_CREATOR),
             "writer": WriterAgent(self.llm, AgentType.CONTENT_CREATOR),
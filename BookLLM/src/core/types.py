@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
@@ -54,6 +55,12 @@ class Config:
     author: str = "Unknown"
 
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide ``Config`` shared by all agents."""
+    return Config()
+
+
 @dataclass
 class AgentInput:
     """Generic input for agents."""
@@ -2,11 +2,15 @@ import asyncio
 import subprocess
 import time
 import hashlib
-from typing import Any, Dict, Optional, Tuple
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 import tiktoken
 
 from ..models.config import CostConfig, ModelConfig, SystemConfig
+from ..utils.concurrency import close_with_loop
 from ..utils.metrics import TokenMetricsTracker
 from ..utils.logger import get_logger
 
@@ -34,18 +38,93 @@ class LLMInterface:
             return 0
         return len(self.encoding.encode(text))
 
+    def truncate_tokens(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of ``text`` that fits in ``max_tokens``"""
+        # Tokens are rarely longer than a few characters, so only a bounded
+        # prefix of a long chapter needs encoding
+        head = text[: max_tokens * 8]
+        tokens = self.encoding.encode(head)
+        if len(tokens) <= max_tokens:
+            return head
+        return self.encoding.decode(tokens[:max_tokens])
+
     def _verify_setup(self) -> bool:
         """Verify basic LLM setup"""
         return bool(self.model_config.name)
 
+    async def acall_llm_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Tuple[str, Dict[str, int]]]:
+        """Submit several prompts together and return responses in prompt order.
+
+        The backends have no multi-prompt request, so the prompts are dispatched
+        at once and the server packs them into its parallel slots (for Ollama,
+        ``OLLAMA_NUM_PARALLEL``). With ``return_exceptions`` a failed prompt
+        yields its exception in place of the response tuple.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.acall_llm(p, system_prompt, **kwargs) for p in prompts),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def astream_llm(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield the response in chunks as it is generated.
+
+        Backends without native streaming yield the complete response once.
+        """
+        response, _ = await self.acall_llm(prompt, system_prompt, **kwargs)
+        yield response
+
+    def embed(self, text: str) -> List[float]:
+        """Return an embedding of ``text`` using ``model_config.embedding_model``"""
+        raise NotImplementedError(f"{self.__class__.__name__} has no embeddings")
+
 
 class EnhancedLLMInterface(LLMInterface):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = get_logger(__name__)  # Use consistent logger
         self.metrics = TokenMetricsTracker()  # Initialize metrics tracking
+        # One pooled HTTP client per event loop; httpx clients cannot be
+        # shared across loops and run_async may start a fresh loop per call,
+        # so each client is closed along with its loop
+        self._clients = weakref.WeakKeyDictionary()
         self._check_ollama_setup()
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the keep-alive client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            connections = self.system_config.max_workers * max(
+                1, self.system_config.batch_size
+            )
+            client = httpx.AsyncClient(
+                base_url=self.model_config.base_url,
+                timeout=self.model_config.timeout,
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+            )
+            self._clients[loop] = client
+            close_with_loop(self._aclose_http_client)
+        return client
+
+    async def _aclose_http_client(self) -> None:
+        """Close the running loop's client, releasing its keep-alive sockets"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
     def _validate_prompt(self, prompt: str) -> None:
         """Basic validation for prompts before sending to the LLM."""
         if not prompt or not prompt.strip():
@@ -121,22 +200,26 @@ class EnhancedLLMInterface(LLMInterface):
 
         for attempt in range(self.system_config.max_retries):
             try:
-                # Removed --format json flag since it's not supported
-                cmd = ["ollama", "run", self.model_config.name, "--nowordwrap"]
-
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                # Talk to the Ollama server directly so concurrent calls reuse
+                # pooled connections instead of spawning a CLI process each
+                resp = await self._http_client().post(
+                    "/api/generate",
+                    json={
+                        "model": self.model_config.name,
+                        "prompt": full_prompt,
+                        "stream": False,
+                        "options": {
+                            "temperature": self.model_config.temperature,
+                            "top_p": self.model_config.top_p,
+                            "repeat_penalty": self.model_config.repeat_penalty,
+                        },
+                    },
                 )
 
-                stdout, stderr = await process.communicate(full_prompt.encode())
-
-                if process.returncode != 0:
-                    raise RuntimeError(f"LLM call failed: {stderr.decode()}")
+                if resp.status_code != 200:
+                    raise RuntimeError(f"LLM call failed: {resp.text}")
 
-                response = stdout.decode(errors="replace").strip()
+                response = resp.json().get("response", "").strip()
                 output_tokens = self.estimate_tokens(response)
 
                 # Update cumulative metrics
@@ -161,6 +244,80 @@ class EnhancedLLMInterface(LLMInterface):
         # This part should ideally not be reached if max_retries > 0
         raise RuntimeError("LLM call failed after all retries.")
 
+    async def astream_llm(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield response text as the Ollama server generates it.
+
+        Unlike ``acall_llm`` there is no retry: once text has been yielded a
+        failed call cannot be replayed transparently. Token usage comes from
+        the final event's counts rather than re-tokenizing the response.
+        """
+        if system_prompt is None:
+            system_prompt = (
+                "You are a professional author and content creator. "
+                "Provide comprehensive, well-structured content."
+            )
+
+        self._validate_prompt(prompt)
+
+        full_prompt = f"{system_prompt}\n\n{prompt}"
+        request_id = hashlib.md5(full_prompt.encode()).hexdigest()
+
+        parts = []
+        final: Dict[str, Any] = {}
+        async with self._http_client().stream(
+            "POST",
+            "/api/generate",
+            json={
+                "model": self.model_config.name,
+                "prompt": full_prompt,
+                "stream": True,
+                "options": {
+                    "temperature": self.model_config.temperature,
+                    "top_p": self.model_config.top_p,
+                    "repeat_penalty": self.model_config.repeat_penalty,
+                },
+            },
+        ) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                raise RuntimeError(f"LLM call failed: {resp.text}")
+            # One JSON event per line; the last has ``done`` and the counts
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                event = orjson.loads(line)
+                if event.get("error"):
+                    raise RuntimeError(f"LLM call failed: {event['error']}")
+                text = event.get("response", "")
+                if text:
+                    parts.append(text)
+                    yield text
+                if event.get("done"):
+                    final = event
+
+        input_tokens = final.get("prompt_eval_count") or self.estimate_tokens(
+            full_prompt
+        )
+        output_tokens = final.get("eval_count") or self.estimate_tokens("".join(parts))
+        self.metrics.add_usage(
+            input_tokens,
+            output_tokens,
+            self.cost_config,
+            request_id=request_id,
+        )
+
+    def embed(self, text: str) -> List[float]:
+        """Return an embedding of ``text`` from the Ollama server"""
+        resp = httpx.post(
+            f"{self.model_config.base_url}/api/embeddings",
+            json={"model": self.model_config.embedding_model, "prompt": text},
+            timeout=self.model_config.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()["embedding"]
+
     def call_llm(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> Tuple[str, Dict[str, int]]:
@@ -1,6 +1,6 @@
 import asyncio
 import hashlib
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import openai
 
@@ -18,6 +18,7 @@ class OpenAIInterface(LLMInterface):
         self.logger = get_logger(__name__)
         self.metrics = TokenMetricsTracker()
         self.client = openai.AsyncOpenAI()
+        self._embedding_client: Optional[openai.OpenAI] = None
 
     async def acall_llm(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
@@ -32,6 +33,11 @@ class OpenAIInterface(LLMInterface):
         input_tokens = self.estimate_tokens(full_prompt)
         request_id = hashlib.md5(full_prompt.encode()).hexdigest()
 
+        extra_body = {}
+        if kwargs.get("cache_key"):
+            # Requests sharing a static prefix are routed to the same prompt cache
+            extra_body["prompt_cache_key"] = kwargs["cache_key"]
+
         for attempt in range(self.system_config.max_retries):
             try:
                 resp = await self.client.chat.completions.create(
@@ -42,6 +48,7 @@ class OpenAIInterface(LLMInterface):
                     ],
                     temperature=self.model_config.temperature,
                     max_tokens=self.model_config.max_tokens,
+                    extra_body=extra_body or None,
                 )
                 text = resp.choices[0].message.content.strip()
                 usage = resp.usage
@@ -67,6 +74,66 @@ class OpenAIInterface(LLMInterface):
                 await asyncio.sleep(self.system_config.retry_delay * (2**attempt))
         raise RuntimeError("LLM call failed after all retries")
 
+    async def astream_llm(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Yield completion deltas as the API streams them (no retry)"""
+        if system_prompt is None:
+            system_prompt = (
+                "You are a professional author and content creator. "
+                "Provide comprehensive, well-structured content."
+            )
+        full_prompt = f"{system_prompt}\n\n{prompt}"
+        request_id = hashlib.md5(full_prompt.encode()).hexdigest()
+
+        extra_body = {}
+        if kwargs.get("cache_key"):
+            extra_body["prompt_cache_key"] = kwargs["cache_key"]
+
+        stream = await self.client.chat.completions.create(
+            model=self.model_config.name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=self.model_config.temperature,
+            max_tokens=self.model_config.max_tokens,
+            extra_body=extra_body or None,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        parts = []
+        usage = None
+        async for event in stream:
+            if event.usage:
+                usage = event.usage
+            if event.choices and event.choices[0].delta.content:
+                parts.append(event.choices[0].delta.content)
+                yield event.choices[0].delta.content
+
+        if usage:
+            input_tokens = usage.prompt_tokens
+            output_tokens = usage.completion_tokens
+        else:
+            input_tokens = self.estimate_tokens(full_prompt)
+            output_tokens = self.estimate_tokens("".join(parts))
+        self.metrics.add_usage(
+            input_tokens,
+            output_tokens,
+            self.cost_config,
+            request_id=request_id,
+        )
+
+    def embed(self, text: str) -> List[float]:
+        """Return an embedding of ``text`` from the embeddings API"""
+        if self._embedding_client is None:
+            # Cache lookups are synchronous, so embeddings use a blocking client
+            self._embedding_client = openai.OpenAI()
+        resp = self._embedding_client.embeddings.create(
+            model=self.model_config.embedding_model, input=text
+        )
+        return resp.data[0].embedding
+
     def call_llm(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> Tuple[str, Dict[str, int]]:
@@ -154,6 +154,8 @@ class ExternalKnowledgeRetriever:
         self.logger = get_logger(__name__)
         self.cache_duration = timedelta(hours=24)
         self.knowledge_cache = {}
+        # Retrievals in progress, so concurrent callers share one fetch
+        self._pending: Dict[str, asyncio.Task] = {}
     
     async def get_comprehensive_knowledge(self, topic: str, domain: str) -> List[KnowledgeSource]:
         """Retrieve comprehensive knowledge from multiple sources"""
@@ -164,6 +166,16 @@ class ExternalKnowledgeRetriever:
             if datetime.now() - timestamp < self.cache_duration:
                 return cached_data
 
+        task = self._pending.get(cache_key)
+        # The retriever is shared process-wide; a task left behind by another
+        # event loop cannot be awaited here
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._retrieve_knowledge(cache_key, topic, domain))
+            self._pending[cache_key] = task
+            task.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _retrieve_knowledge(self, cache_key: str, topic: str, domain: str) -> List[KnowledgeSource]:
         knowledge_sources = []
 
         # Retrieve from multiple sources in parallel
@@ -186,6 +198,10 @@ class ExternalKnowledgeRetriever:
 
     async def _get_wikipedia_knowledge(self, topic: str) -> List[KnowledgeSource]:
         """Retrieve relevant Wikipedia articles"""
+        # The wikipedia client blocks; keep the event loop free meanwhile
+        return await asyncio.to_thread(self._fetch_wikipedia_knowledge, topic)
+
+    def _fetch_wikipedia_knowledge(self, topic: str) -> List[KnowledgeSource]:
         try:
             # Search for relevant pages
             search_results = wikipedia.search(topic, results=3)
@@ -229,6 +245,9 @@ class ExternalKnowledgeRetriever:
 
     async def _get_arxiv_papers(self, topic: str, domain: str) -> List[KnowledgeSource]:
         """Retrieve relevant arXiv papers for technical topics"""
+        return await asyncio.to_thread(self._fetch_arxiv_papers, topic, domain)
+
+    def _fetch_arxiv_papers(self, topic: str, domain: str) -> List[KnowledgeSource]:
         try:
             # Search arXiv for recent papers
             search = arxiv.Search(
@@ -300,6 +319,10 @@ class DomainExpertSystem:
         self.knowledge_retriever = ExternalKnowledgeRetriever()
         self.logger = get_logger(__name__)
 
+    async def prewarm(self, topic: str, domain: str) -> None:
+        """Start retrieving knowledge for ``topic`` before content is ready"""
+        await self.knowledge_retriever.get_comprehensive_knowledge(topic, domain)
+
     async def enhance_content_with_expertise(self, content: str, topic: str, domain: str) -> str:
         """Enhance content with domain expertise and external knowledge"""
 
@@ -14,6 +14,8 @@ class ModelConfig:
     top_p: float = 0.9
     repeat_penalty: float = 1.1
     timeout: int = 120
+    base_url: str = "http://localhost:11434"
+    embedding_model: str = ""
 
 
 @dataclass
@@ -35,6 +37,9 @@ class SystemConfig:
     retry_delay: float = 2.0
     parallel_agents: bool = True
     max_workers: int = 4
+    batch_size: int = 1
+    stream_chapters: bool = False
+    cache_responses: bool = True
     save_intermediates: bool = True
     backup_frequency: int = 5
     max_steps: int = 50
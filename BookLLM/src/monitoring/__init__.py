@@ -1,8 +1,10 @@
-from .monitoring_agent import status_updates
+from .monitoring_agent import status_updates, subscribe_status, unsubscribe_status
 from .start_tracker import agent_start_times, mark_start
 
 __all__ = [
     "status_updates",
+    "subscribe_status",
+    "unsubscribe_status",
     "agent_start_times",
     "mark_start",
 ]
@@ -1,7 +1,8 @@
 import asyncio
 import json
+import threading
 from queue import SimpleQueue
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 import aiohttp
 
@@ -10,6 +11,43 @@ from ..utils.logger import get_logger
 # Global queue used as a simple UI bus for status updates
 status_updates: "SimpleQueue[Dict[str, Any]]" = SimpleQueue()
 
+# Per-subscriber queues; each update on ``status_updates`` is copied to all
+_subscribers: "Set[SimpleQueue[Dict[str, Any]]]" = set()
+_subscribers_lock = threading.Lock()
+_fan_out_thread: threading.Thread | None = None
+
+
+def _fan_out() -> None:
+    while True:
+        payload = status_updates.get()
+        with _subscribers_lock:
+            subscribers = tuple(_subscribers)
+        for queue in subscribers:
+            queue.put(payload)
+
+
+def subscribe_status() -> "SimpleQueue[Dict[str, Any]]":
+    """Return a queue receiving every status update from now on.
+
+    Pair with ``unsubscribe_status``. Once the first subscriber exists, updates
+    published while nobody is subscribed are dropped instead of piling up.
+    """
+    global _fan_out_thread
+    queue: "SimpleQueue[Dict[str, Any]]" = SimpleQueue()
+    with _subscribers_lock:
+        _subscribers.add(queue)
+        if _fan_out_thread is None:
+            _fan_out_thread = threading.Thread(
+                target=_fan_out, name="status-fan-out", daemon=True
+            )
+            _fan_out_thread.start()
+    return queue
+
+
+def unsubscribe_status(queue: "SimpleQueue[Dict[str, Any]]") -> None:
+    with _subscribers_lock:
+        _subscribers.discard(queue)
+
 
 class MonitoringAgent:
     """Poll an orchestration server and emit status updates."""
@@ -401,15 +401,16 @@ class ProfessionalQualityOrchestrator:
         # Combine all chapter content for analysis
         full_content = "\\n\\n".join(state.chapter_map.values())
         
-        # Parallel quality checks
+        # Parallel quality checks; the CPU-bound scorers run in worker threads
+        # so they neither serialize with each other nor block the event loop
         tasks = [
-            self._assess_content_depth(full_content, state.topic),
+            asyncio.to_thread(self._assess_content_depth, full_content, state.topic),
             self._assess_technical_accuracy(full_content, state.topic),
             self._assess_factual_accuracy(full_content, state.topic),
-            self._assess_coherence(full_content),
-            self._assess_expertise_level(full_content, state.topic),
-            self._assess_originality(full_content),
-            self._assess_pedagogical_quality(full_content, state.target_audience)
+            asyncio.to_thread(self._assess_coherence, full_content),
+            asyncio.to_thread(self._assess_expertise_level, full_content, state.topic),
+            asyncio.to_thread(self._assess_originality, full_content),
+            asyncio.to_thread(self._assess_pedagogical_quality, full_content, state.target_audience)
         ]
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -455,7 +456,7 @@ class ProfessionalQualityOrchestrator:
         
         return metrics
     
-    async def _assess_content_depth(self, content: str, topic: str) -> float:
+    def _assess_content_depth(self, content: str, topic: str) -> float:
         """Assess content depth and comprehensiveness"""
         depth_analysis = self.depth_analyzer.analyze_content_depth(content, topic)
         return sum(depth_analysis.values()) / len(depth_analysis)
@@ -475,12 +476,12 @@ class ProfessionalQualityOrchestrator:
         verified_claims = sum(1 for result in fact_check_results if result.verified)
         return verified_claims / len(fact_check_results)
     
-    async def _assess_coherence(self, content: str) -> float:
+    def _assess_coherence(self, content: str) -> float:
         """Assess logical coherence"""
         coherence_analysis = self.coherence_analyzer.analyze_coherence(content)
         return sum(coherence_analysis.values()) / len(coherence_analysis)
     
-    async def _assess_expertise_level(self, content: str, topic: str) -> float:
+    def _assess_expertise_level(self, content: str, topic: str) -> float:
         """Assess demonstrated expertise level"""
         expertise_indicators = [
             'best practice', 'industry standard', 'common pitfall', 'pro tip',
@@ -499,7 +500,7 @@ class ProfessionalQualityOrchestrator:
         
         return min(expertise_density / 2, 1.0)
     
-    async def _assess_originality(self, content: str) -> float:
+    def _assess_originality(self, content: str) -> float:
         """Assess content originality and uniqueness"""
         # Simple originality check based on content patterns
         generic_phrases = [
@@ -517,7 +518,7 @@ class ProfessionalQualityOrchestrator:
         # Higher originality = lower generic phrase usage
         return max(1.0 - generic_ratio * 0.5, 0.0)
     
-    async def _assess_pedagogical_quality(self, content: str, target_audience: str) -> float:
+    def _assess_pedagogical_quality(self, content: str, target_audience: str) -> float:
         """Assess pedagogical effectiveness"""
         pedagogical_elements = [
             'learning objective', 'prerequisite', 'example', 'exercise',
@@ -87,6 +87,7 @@ class RealTimeStatusManager:
         self.websocket_clients: List[websockets.WebSocketServerProtocol] = []
         self.update_queue = Queue()
         self.is_running = False
+        self._websocket_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Performance tracking
         self.agent_start_times: Dict[str, datetime] = {}
@@ -94,14 +95,23 @@ class RealTimeStatusManager:
         
     def start_status_manager(self):
         """Start the real-time status management system"""
+        if self.is_running:
+            return
         self.is_running = True
         
-        # Start WebSocket server
-        asyncio.create_task(self._start_websocket_server())
-        
-        # Start status update processor
+        # Start status update processor; listeners (SSE clients) depend only
+        # on this thread, not on the WebSocket server below
         threading.Thread(target=self._process_status_updates, daemon=True).start()
         
+        # Start WebSocket server on the caller's loop, or on a loop of its own
+        # when called from synchronous code (e.g. under Flask)
+        try:
+            asyncio.get_running_loop().create_task(self._start_websocket_server())
+        except RuntimeError:
+            threading.Thread(
+                target=asyncio.run, args=(self._start_websocket_server(),), daemon=True
+            ).start()
+        
         self.logger.info("Real-time status manager started")
     
     def stop_status_manager(self):
@@ -129,6 +139,7 @@ class RealTimeStatusManager:
                         self.websocket_clients.remove(websocket)
                     self.logger.info(f"WebSocket client disconnected")
             
+            self._websocket_loop = asyncio.get_running_loop()
             server = await websockets.serve(handle_client, host, port)
             self.logger.info(f"WebSocket server started on ws://{host}:{port}")
             
@@ -259,16 +270,20 @@ class RealTimeStatusManager:
                 # Get update from queue (blocking with timeout)
                 update = self.update_queue.get(timeout=1.0)
                 
-                # Broadcast to all WebSocket clients
-                asyncio.create_task(self._broadcast_update(update))
-                
-                # Notify other listeners
-                for listener in self.listeners:
+                # Notify other listeners first (a copy, as SSE clients come
+                # and go) so a failed WebSocket broadcast cannot skip them
+                for listener in list(self.listeners):
                     try:
                         listener(update)
                     except Exception as e:
                         self.logger.warning(f"Listener error: {e}")
                 
+                # Broadcast to all WebSocket clients on the server's loop
+                if self.websocket_clients and self._websocket_loop:
+                    asyncio.run_coroutine_threadsafe(
+                        self._broadcast_update(update), self._websocket_loop
+                    )
+                
             except Empty:
                 continue
             except Exception as e:
@@ -324,6 +339,16 @@ class RealTimeStatusManager:
         if listener in self.listeners:
             self.listeners.remove(listener)
     
+    def subscribe(self) -> Queue:
+        """Return a queue that receives every status update from now on"""
+        queue = Queue()
+        self.add_listener(queue.put_nowait)
+        return queue
+    
+    def unsubscribe(self, queue: Queue):
+        """Stop delivering updates to a queue returned by ``subscribe``"""
+        self.remove_listener(queue.put_nowait)
+    
     def get_current_status(self) -> Dict[str, Any]:
         """Get complete current status for API endpoints"""
         
@@ -1,5 +1,6 @@
 # Step 1: Export utility helpers
 from .case_study_formatter import CaseStudyFormatter
+from .concurrency import get_process_pool, run_async
 from .logger import get_logger, log_progress_json
 from .metrics import QualityMetricsTracker, TokenMetricsTracker
 from .step_tracker import StepTracker, step_tracker
@@ -16,4 +17,6 @@ __all__ = [
     "StyleGuideEnforcer",
     "remove_outline_dicts",
     "CaseStudyFormatter",
+    "run_async",
+    "get_process_pool",
 ]
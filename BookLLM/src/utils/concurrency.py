@@ -0,0 +1,64 @@
+import asyncio
+import atexit
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+AsyncCloser = Callable[[], Awaitable[None]]
+
+# Loop-bound async resources (pooled HTTP clients), closed before their loop
+_loop_closers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def close_with_loop(aclose: AsyncCloser) -> None:
+    """Await ``aclose`` on the running loop before ``run_async`` finishes it"""
+    _loop_closers.setdefault(asyncio.get_running_loop(), []).append(aclose)
+
+
+async def _run_and_close(coro: Awaitable[T]) -> T:
+    try:
+        return await coro
+    finally:
+        for aclose in _loop_closers.pop(asyncio.get_running_loop(), []):
+            try:
+                await aclose()
+            except Exception:
+                pass  # Cleanup must not mask the coroutine's own result
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    ``asyncio.run`` is used when no event loop is running in the current
+    thread. When called from inside a running loop (for example when the UI
+    orchestrator awaits the synchronous graph), the coroutine is executed on a
+    fresh loop in a worker thread instead. Either way, resources registered
+    with :func:`close_with_loop` are closed before that loop shuts down.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_run_and_close(coro))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _run_and_close(coro)).result()
+
+
+@lru_cache(maxsize=None)
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool for CPU-bound work.
+
+    Workers start on first use and are reused by every caller, so agents do
+    not pay process start-up per call. One worker per CPU.
+
+    Workers come from a forkserver rather than ``fork``: by the time the pool
+    starts, HTTP, SSE and progress-bar threads are running, and forking could
+    copy a lock one of them holds.
+    """
+    pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
+    atexit.register(pool.shutdown)
+    return pool
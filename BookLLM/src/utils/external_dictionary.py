@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Dict, Iterable
 
+
+@lru_cache(maxsize=4096)
 def lookup(token: str) -> str:
     """Return a placeholder definition for an acronym."""
     return f"Definition of {token}"
+
+
+def lookup_many(tokens: Iterable[str]) -> Dict[str, str]:
+    """Return definitions for ``tokens`` in one call, reusing earlier lookups."""
+    return {token: lookup(token) for token in tokens}
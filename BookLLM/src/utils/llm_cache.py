@@ -0,0 +1,126 @@
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+EmbedFn = Callable[[str], Sequence[float]]
+
+CACHE_STRATEGIES = ("exact-match", "semantic")
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticCache:
+    """Persistent SQLite cache for LLM responses.
+
+    Lookups first try an exact match on the prompt hash (blake2b over the
+    prompt and the caller's namespace of model parameters). When an ``embed_fn``
+    is configured, semantic lookups fall back to the stored prompt with the
+    highest cosine similarity at or above ``threshold``.
+    """
+
+    def __init__(
+        self, path: Path, embed_fn: Optional[EmbedFn] = None, threshold: float = 0.95
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        # A miss embeds the prompt in get() and again in put(); keep the last
+        self._last_embedding: Optional[tuple] = None
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+            "response TEXT NOT NULL, embedding TEXT)"
+        )
+        self._conn.commit()
+
+    def _embed(self, prompt: str) -> Optional[Sequence[float]]:
+        """Embed ``prompt``, or ``None`` if the embedding backend fails"""
+        last = self._last_embedding
+        if last is not None and last[0] == prompt:
+            return last[1]
+        try:
+            embedding = list(self.embed_fn(prompt))
+        except Exception:
+            # Semantic lookups are best effort; fall back to exact matches
+            return None
+        self._last_embedding = (prompt, embedding)
+        return embedding
+
+    @staticmethod
+    def _key(prompt: str, namespace: str) -> str:
+        return hashlib.blake2b(f"{namespace}\0{prompt}".encode()).hexdigest()
+
+    def get(
+        self, prompt: str, namespace: str = "", semantic: bool = False
+    ) -> Optional[str]:
+        """Return a cached response for ``prompt`` or ``None`` on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?",
+                (self._key(prompt, namespace),),
+            ).fetchone()
+            if row:
+                return row[0]
+            if not (semantic and self.embed_fn):
+                return None
+            rows = self._conn.execute(
+                "SELECT response, embedding FROM responses "
+                "WHERE namespace = ? AND embedding IS NOT NULL",
+                (namespace,),
+            ).fetchall()
+
+        query = self._embed(prompt)
+        if query is None:
+            return None
+        best, best_score = None, self.threshold
+        for response, embedding in rows:
+            score = _cosine(query, json.loads(embedding))
+            if score >= best_score:
+                best, best_score = response, score
+        return best
+
+    def put(self, prompt: str, response: str, namespace: str = "") -> None:
+        """Store ``response`` for ``prompt``"""
+        vector = self._embed(prompt) if self.embed_fn else None
+        embedding = json.dumps(vector) if vector is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self._key(prompt, namespace), namespace, response, embedding),
+            )
+            self._conn.commit()
+
+
+def source_hash(text: str) -> str:
+    """Short fingerprint of an agent's inputs, used to skip idempotent re-runs"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_response_cache(path: str, embed_fn: Optional[EmbedFn] = None) -> SemanticCache:
+    """Return the process-wide cache stored at ``path`` for ``embed_fn``"""
+    return SemanticCache(Path(path), embed_fn=embed_fn)
+
+
+def cacheable(strategy: str = "exact-match"):
+    """Class decorator marking an agent's LLM responses as cacheable"""
+    if strategy not in CACHE_STRATEGIES:
+        raise ValueError(f"Unknown cache strategy: {strategy}")
+
+    def decorator(cls):
+        cls.cache_strategy = strategy
+        return cls
+
+    return decorator
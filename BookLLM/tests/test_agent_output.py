@@ -0,0 +1,59 @@
+import asyncio
+import json
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.agents.base import BaseAgent
+from BookLLM.src.agents.content.back_matter import AcknowledgmentsAgent
+from BookLLM.src.agents.content.front_matter import TitlePageAgent
+from BookLLM.src.models.state import BookState
+
+
+class DummyLLM:
+    def __init__(self, output_dir):
+        self.system_config = types.SimpleNamespace(output_dir=output_dir)
+
+
+def test_save_agent_output_writes_snapshot(tmp_path):
+    agent = AcknowledgmentsAgent(DummyLLM(tmp_path))
+    state = BookState(topic="LLM", acknowledgments="Thanks")
+
+    asyncio.run(agent._asave_agent_output(state, "AcknowledgmentsAgent"))
+
+    (saved,) = (tmp_path / "agent_outputs").glob("AcknowledgmentsAgent_*.json")
+    data = json.loads(saved.read_text())
+    assert data["topic"] == "LLM"
+    assert data["acknowledgments"] == "Thanks"
+
+
+def test_serialize_state_falls_back_for_unknown_metadata():
+    state = BookState(topic="LLM", metadata={"source": object()})
+
+    data = json.loads(AcknowledgmentsAgent._serialize_state(state))
+
+    assert data["topic"] == "LLM"
+    assert data["metadata"]["source"].startswith("<object object")
+
+
+def test_title_page_skips_unchanged_tex(tmp_path):
+    agent = TitlePageAgent(DummyLLM(tmp_path))
+    state = BookState(topic="LLM")
+
+    agent._execute_logic(state)
+    tex_path = tmp_path / "title.tex"
+    mtime = tex_path.stat().st_mtime_ns
+    agent._execute_logic(state)
+
+    assert tex_path.stat().st_mtime_ns == mtime
+    assert tex_path.read_text() == state.title_page
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_parse_json_keeps_prose_wrapped_array_of_objects():
+    response = 'Here:\n[{"q": "a"}, {"q": "b"}]\nHope this helps {maybe}.'
+
+    assert BaseAgent._parse_json(response) == [{"q": "a"}, {"q": "b"}]
+    assert BaseAgent._parse_json('Result: {"items": [1, 2]} done') == {"items": [1, 2]}
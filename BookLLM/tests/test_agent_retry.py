@@ -0,0 +1,49 @@
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.agents.base import MAX_RETRY_DELAY, BaseAgent
+from BookLLM.src.models.agent_type import AgentType
+from BookLLM.src.models.state import BookState
+
+
+class DummyLLM:
+    def __init__(self):
+        self.system_config = types.SimpleNamespace(
+            max_retries=3, retry_delay=0.0, save_intermediates=False
+        )
+
+
+class FlakyAgent(BaseAgent):
+    def __init__(self, failures):
+        super().__init__(DummyLLM(), AgentType.CONTENT_CREATOR)
+        self.failures = failures
+
+    def _execute_logic(self, state):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("flaky")
+        return state
+
+
+def test_aprocess_retries_until_success():
+    state = asyncio.run(FlakyAgent(failures=2).aprocess(BookState(topic="LLM")))
+
+    assert state.completed_steps == ["FlakyAgent"]
+    assert state.errors == []
+
+
+def test_aprocess_records_final_failure():
+    state = asyncio.run(FlakyAgent(failures=5).aprocess(BookState(topic="LLM")))
+
+    assert state.completed_steps == []
+    assert state.errors == ["FlakyAgent: flaky"]
+
+
+def test_backoff_is_jittered_and_capped():
+    for previous in (1.0, 10.0, 100.0):
+        backoff = BaseAgent._next_backoff(1.0, previous)
+        assert 1.0 <= backoff <= min(MAX_RETRY_DELAY, previous * 3)
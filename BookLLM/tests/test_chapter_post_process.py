@@ -1,9 +1,11 @@
+import asyncio
 import sys
+import types
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from BookLLM.src.agents.content.chapter import ChapterWriterAgent
+from BookLLM.src.agents.content.chapter import CHAPTER_TEMPLATE, ChapterWriterAgent
 from BookLLM.src.models.state import BookState
 
 
@@ -17,3 +19,136 @@ def test_post_process_inserts_header():
     agent = ChapterWriterAgent(DummyLLM())
     result = agent._post_process_chapter("Some text", state, "Intro")
     assert result.startswith("# Chapter 1: Intro")
+
+
+class AsyncDummyLLM:
+    def __init__(self, max_workers, batch_size=1):
+        self.system_config = types.SimpleNamespace(
+            parallel_agents=True, max_workers=max_workers, batch_size=batch_size
+        )
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def acall_llm(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return ("Body", {})
+
+    async def acall_llm_batch(self, prompts, return_exceptions=False, **kwargs):
+        self.batches.append(len(prompts))
+        return await asyncio.gather(
+            *(self.acall_llm(p) for p in prompts), return_exceptions=return_exceptions
+        )
+
+
+class StreamingDummyLLM(AsyncDummyLLM):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.system_config.stream_chapters = True
+
+    async def astream_llm(self, prompt, **kwargs):
+        for chunk in ["Intro example\n|", " a |\n", "```py\nx\n``", "`\nEnd"]:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+def test_parallel_chapters_respect_max_workers():
+    llm = AsyncDummyLLM(max_workers=2)
+    state = BookState(topic="LLM", chapters=["One", "Two", "Three", "Four"])
+    agent = ChapterWriterAgent(llm)
+    result = agent._execute_logic(state)
+    assert set(result.chapter_map) == {"One", "Two", "Three", "Four"}
+    assert result.chapter_map["Three"].startswith("# Chapter 3: Three")
+    assert llm.max_in_flight == 2
+
+
+def test_parallel_chapters_are_batched():
+    llm = AsyncDummyLLM(max_workers=1, batch_size=2)
+    state = BookState(topic="LLM", chapters=["One", "Two", "Three"])
+    agent = ChapterWriterAgent(llm)
+    result = agent._execute_logic(state)
+    assert set(result.chapter_map) == {"One", "Two", "Three"}
+    assert sorted(llm.batches) == [1, 2]
+    assert llm.max_in_flight == 2
+
+
+def test_parallel_chapters_skip_written_chapters():
+    llm = AsyncDummyLLM(max_workers=2)
+    state = BookState(topic="LLM", chapters=["One", "Two", "Three"])
+    state.chapter_map["Two"] = "Existing"
+    agent = ChapterWriterAgent(llm)
+    result = agent._execute_logic(state)
+    assert result.chapter_map["Two"] == "Existing"
+    assert sum(llm.batches) == 2
+
+
+def test_chapter_prompts_share_static_prefix():
+    state = BookState(topic="LLM", chapters=["One", "Two"])
+    agent = ChapterWriterAgent(DummyLLM())
+    first = agent._build_chapter_prompt("One", state, 0, "")
+    second = agent._build_chapter_prompt("Two", state, 1, "Chapter 1: One")
+    assert first.startswith(CHAPTER_TEMPLATE)
+    assert second.startswith(CHAPTER_TEMPLATE)
+    assert '"Two"' in second.split("---")[-1]
+    assert first.split("---")[0] == second.split("---")[0]
+
+
+def test_chapter_statistics_counts():
+    agent = ChapterWriterAgent(DummyLLM())
+    state = BookState(topic="AI")
+    content = (
+        "![fig](a.png) see [docs](http://x)\n"
+        "| a | b |\n| 1 | 2 |\n"
+        "```python\nprint(1)\n```\n"
+        "For Example, and another example; examples and [example](x) too."
+    )
+
+    agent._update_chapter_statistics(content, state)
+
+    assert state.total_images == 1
+    assert state.total_references == 2
+    assert state.total_tables == 2
+    assert state.total_code_blocks == 1
+    assert state.total_examples == 3
+
+
+def test_streamed_chapters_count_statistics_incrementally():
+    llm = StreamingDummyLLM()
+    state = BookState(topic="LLM", chapters=["One", "Two"])
+    result = ChapterWriterAgent(llm)._execute_logic(state)
+
+    assert result.chapter_map["Two"].endswith(
+        "Intro example\n| a |\n```py\nx\n```\nEnd"
+    )
+    assert result.total_tables == 2
+    assert result.total_code_blocks == 2
+    assert result.total_examples == 2
+    assert llm.batches == []
+
+
+def test_previous_chapter_context_is_bounded():
+    chapters = [f"Ch{i}" for i in range(1, 9)]
+    state = BookState(topic="LLM", chapters=chapters)
+    agent = ChapterWriterAgent(DummyLLM())
+
+    context = agent._get_previous_chapters_context(state, 7).splitlines()
+
+    assert len(context) == ChapterWriterAgent.PREVIOUS_CONTEXT_CHAPTERS
+    assert context[0].startswith("Chapter 3: Ch3")
+    assert context[-1].startswith("Chapter 7: Ch7")
+
+
+def test_navigation_header_links_neighbours():
+    state = BookState(topic="LLM", chapters=["First Steps", "Core Ideas", "Wrap Up"])
+    agent = ChapterWriterAgent(DummyLLM())
+
+    assert agent._create_navigation_header("Core Ideas", state) == (
+        "[<< First Steps](#chapter-1-first-steps) | **Core Ideas** | "
+        "[Wrap Up >>](#chapter-3-wrap-up)"
+    )
+    assert agent._create_navigation_header("First Steps", state) == (
+        "**First Steps** | [Core Ideas >>](#chapter-2-core-ideas)"
+    )
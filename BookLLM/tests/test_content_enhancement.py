@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+# core is imported first: its package init builds the graph of content agents
+from BookLLM.src.core.types import AgentInput, Config, SectionMeta
+from BookLLM.src.content.enhancement.acronym import AcronymAgent
+from BookLLM.src.content.enhancement.enhancer import ContentEnhancementAgent
+from BookLLM.src.content.enhancement.labels import LabelGeneratorAgent
+from BookLLM.src.content.front_matter.toc import LabelOutput, TOCBuilderAgent
+from BookLLM.src.models.state import BookState
+from BookLLM.src.utils import external_dictionary
+
+
+def test_acronym_agent_expands_first_use_only():
+    output = AcronymAgent(Config()).run(
+        AgentInput(content="An API call, another API call and an APIX over HTTP.")
+    )
+
+    assert output.resolved_content.startswith(
+        "An Definition of API (API) call, another API call and an "
+        "Definition of APIX (APIX) over Definition of HTTP (HTTP)."
+    )
+    assert set(output.acronym_glossary) == {"API", "APIX", "HTTP"}
+
+
+def test_external_dictionary_memoizes_lookups():
+    external_dictionary.lookup.cache_clear()
+
+    external_dictionary.lookup_many(["API", "HTTP"])
+    definitions = external_dictionary.lookup_many(["API", "SQL"])
+
+    assert definitions == {"API": "Definition of API", "SQL": "Definition of SQL"}
+    assert external_dictionary.lookup.cache_info().hits == 1
+
+
+def test_content_enhancement_splices_questions_and_examples():
+    text = "# A\nalpha\n# B\nbeta\n## Example: One\n## Example: Two\n"
+    outline = [SectionMeta("A", 0, 10), SectionMeta("B", 10, 19)]
+
+    output = ContentEnhancementAgent(Config()).run(
+        AgentInput(content=text, outline=outline)
+    )
+
+    assert output.enhanced_content == (
+        "# A\nalpha\n\n\n> What did you learn in A?\n"
+        "# B\nbeta\n\n\n> What did you learn in B?\n"
+        "## Example: One\n\nFor instance, one can be applied in real-world situations.\n"
+        "\n## Example: Two\n\nFor instance, two can be applied in real-world situations.\n"
+        "\n"
+    )
+    assert [e.element_type for e in output.added_elements] == [
+        "question",
+        "question",
+        "example",
+        "example",
+    ]
+
+
+def test_content_enhancement_process_enhances_every_chapter():
+    chapters = {f"Ch{i}": f"## Example: Topic {i}\n" for i in range(20)}
+    state = BookState(topic="LLM", chapter_map=dict(chapters))
+
+    ContentEnhancementAgent(Config()).process(state)
+
+    assert list(state.chapter_map) == list(chapters)
+    assert all(
+        f"For instance, topic {i}" in state.chapter_map[f"Ch{i}"] for i in range(20)
+    )
+    assert set(state.metadata["enhanced_elements"]) == set(chapters)
+
+
+def test_heading_labels_match_toc_links():
+    output = LabelGeneratorAgent(Config()).run(
+        AgentInput(content="# Don't Panic: C++ & Rust\ntext")
+    )
+
+    assert output.labels == {"Don't Panic: C++ & Rust": "don-t-panic-c-rust"}
+    assert output.labeled_content.splitlines()[1] == "{#don-t-panic-c-rust}"
+    toc = TOCBuilderAgent(Config()).run([LabelOutput("Don't Panic: C++ & Rust")])
+    assert toc.toc_markdown.endswith("(#don-t-panic-c-rust)")
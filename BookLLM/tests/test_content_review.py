@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+# core is imported first: its package init builds the graph of content agents
+from BookLLM.src.core.types import AgentInput, Config
+from BookLLM.src.content.review.proofreader import ReviewerAgent
+
+
+def test_reviewer_applies_all_suggestions_in_one_pass():
+    output = ReviewerAgent(Config()).run(
+        AgentInput(content="Fix teh  typo   here. Then  teh next one.")
+    )
+
+    assert output.corrected_text == "Fix the typo here. Then the next one."
+    assert [s.position for s in output.suggestions] == [4, 7, 13, 28, 26]
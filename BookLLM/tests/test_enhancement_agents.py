@@ -0,0 +1,238 @@
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.agents.enhancement.case_study import (
+    CASE_STUDY_TEMPLATE_KEY,
+    CaseStudyAgent,
+)
+from BookLLM.src.agents.enhancement.code import CodeSampleAgent
+from BookLLM.src.agents.enhancement.glossary import GlossaryAgent
+from BookLLM.src.agents.enhancement.glossary_linker import GlossaryLinker
+from BookLLM.src.agents.enhancement.quiz import QuizAgent
+from BookLLM.src.agents.enhancement.template import (
+    WORKSHEET_TEMPLATE_KEY,
+    TemplateAgent,
+)
+from BookLLM.src.agents.review.proofreader import (
+    PROOFREAD_TEMPLATE_KEY,
+    ProofreaderAgent,
+)
+from BookLLM.src.interfaces.llm import LLMInterface
+from BookLLM.src.models.agent_type import AgentType
+from BookLLM.src.models.state import BookState
+from BookLLM.src.monitoring import subscribe_status, unsubscribe_status
+
+
+class ExcerptLLM:
+    def truncate_tokens(self, text, max_tokens):
+        return text[:max_tokens]
+
+
+class ConcurrentLLM(ExcerptLLM):
+    def __init__(self, max_workers=2):
+        self.system_config = types.SimpleNamespace(
+            parallel_agents=True, max_workers=max_workers
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def acall_llm(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs.get("cache_key")))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if "Broken" in prompt:
+            raise RuntimeError("boom")
+        return (" study ", {})
+
+
+def _state():
+    chapters = {f"Ch{i}": "code example" for i in range(4)}
+    chapters["Broken"] = "code example"
+    return BookState(topic="LLM", chapter_map=chapters)
+
+
+def test_case_studies_run_concurrently_and_record_failures():
+    llm = ConcurrentLLM()
+    state = CaseStudyAgent(llm)._execute_logic(_state())
+
+    assert state.case_studies == {f"Ch{i}": "study" for i in range(4)}
+    assert state.warnings == ["Case study generation failed for Broken"]
+    assert llm.max_in_flight == 2
+
+
+def test_case_study_prompts_share_book_prefix():
+    llm = ConcurrentLLM()
+    CaseStudyAgent(llm)._execute_logic(_state())
+
+    prefixes = {prompt.split("Chapter-specific inputs:")[0] for prompt, _ in llm.calls}
+    assert len(prefixes) == 1
+    assert {key for _, key in llm.calls} == {CASE_STUDY_TEMPLATE_KEY}
+
+
+def test_code_samples_run_concurrently_and_record_failures():
+    llm = ConcurrentLLM(max_workers=3)
+    state = CodeSampleAgent(llm)._execute_logic(_state())
+
+    assert set(state.code_samples) == {f"Ch{i}" for i in range(4)}
+    assert state.errors == ["Code sample generation failed for Broken"]
+    assert llm.max_in_flight == 3
+
+
+def test_templates_run_concurrently_and_record_failures():
+    llm = ConcurrentLLM()
+    state = TemplateAgent(llm)._execute_logic(_state())
+
+    assert state.templates == {f"Ch{i}": "study" for i in range(4)}
+    assert state.warnings == ["Template generation failed for Broken"]
+    assert llm.max_in_flight == 2
+
+
+def test_template_and_proofreader_prompts_share_static_prefix():
+    llm = ConcurrentLLM()
+    TemplateAgent(llm)._execute_logic(_state())
+    ProofreaderAgent(llm, AgentType.REVIEWER)._execute_logic(_state())
+
+    for key, marker in (
+        (WORKSHEET_TEMPLATE_KEY, "Chapter-specific inputs:"),
+        (PROOFREAD_TEMPLATE_KEY, "Content to proofread:"),
+    ):
+        prompts = [prompt for prompt, cache_key in llm.calls if cache_key == key]
+        assert len(prompts) == 5
+        assert len({prompt.split(marker)[0] for prompt in prompts}) == 1
+
+
+class StreamingLLM(ExcerptLLM):
+    system_config = types.SimpleNamespace(
+        parallel_agents=True, max_workers=2, stream_chapters=True
+    )
+
+    async def astream_llm(self, prompt, **kwargs):
+        for chunk in ("# Work", "sheet "):
+            yield chunk
+
+
+def test_templates_stream_and_report_progress():
+    state = BookState(topic="LLM", chapter_map={"One": "text"})
+    updates = subscribe_status()
+
+    TemplateAgent(StreamingLLM())._execute_logic(state)
+
+    assert state.templates == {"One": "# Worksheet"}
+    update = updates.get(timeout=1)
+    unsubscribe_status(updates)
+    assert update["current_agent"] == "TemplateAgent"
+    assert update["item"] == "One"
+
+
+def test_proofreader_keeps_chapters_that_fail():
+    llm = ConcurrentLLM(max_workers=4)
+    state = _state()
+    state.chapter_map["Broken"] = "Broken text"
+    state = ProofreaderAgent(llm, AgentType.REVIEWER)._execute_logic(state)
+
+    assert state.chapter_map["Broken"] == "Broken text"
+    assert state.chapter_map["Ch0"] == " study "
+    assert llm.max_in_flight == 4
+
+
+def test_glossary_linker_links_first_occurrence_once():
+    state = BookState(
+        topic="LLM",
+        glossary={"API": "d", "neural network": "d", "network": "d"},
+        chapter_map={
+            "One": "An api call. A neural network and a network. API again",
+            "Two": "network and API",
+        },
+    )
+
+    GlossaryLinker(None)._execute_logic(state)
+
+    assert state.chapter_map["One"] == (
+        "An [API](#glossary-api) call. "
+        "A [neural network](#glossary-neural-network) and a "
+        "[network](#glossary-network). API again"
+    )
+    assert state.chapter_map["Two"] == "network and API"
+
+
+class CountingLLM:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def call_llm(self, prompt, **kwargs):
+        self.calls += 1
+        return (self.response, {})
+
+
+def test_glossary_skips_llm_when_chapters_unchanged():
+    llm = CountingLLM('{"API": "Application programming interface"}')
+    agent = GlossaryAgent(llm)
+    state = BookState(topic="LLM", chapter_map={"One": "API text"})
+
+    agent._execute_logic(state)
+    agent._execute_logic(state)
+    assert llm.calls == 1
+
+    state.chapter_map["Two"] = "More text"
+    agent._execute_logic(state)
+    assert llm.calls == 2
+
+
+class QuizLLM(ExcerptLLM):
+    system_config = types.SimpleNamespace(parallel_agents=False)
+
+    def __init__(self):
+        self.prompts = []
+
+    def call_llm(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if len(self.prompts) == 1:
+            return ('{"chapters": {"One": ["Q1", " Q2 "], "Two": []}}', {})
+        return ('["Q3"]', {})
+
+
+def test_quiz_batches_chapters_and_falls_back_for_missing():
+    llm = QuizLLM()
+    state = BookState(topic="LLM", chapter_map={"One": "a", "Two": "b"})
+
+    QuizAgent(llm)._execute_logic(state)
+
+    assert state.check_questions == {"One": ["Q1", "Q2"], "Two": ["Q3"]}
+    assert len(llm.prompts) == 2
+    assert '- Chapter title: "Two"' in llm.prompts[1]
+
+
+def test_proofreader_flags_inconsistent_term_casing():
+    agent = ProofreaderAgent(ConcurrentLLM(), AgentType.REVIEWER)
+    glossary = {"API": "d", "SDK": "d", "REST": "d"}
+
+    issues = agent._check_technical_terms(
+        "An API and an api. One SDK. REST REST", glossary
+    )
+
+    assert len(issues) == 1
+    assert issues[0].startswith("Inconsistent usage of term 'API'")
+
+
+class WordEncoding:
+    def encode(self, text):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def test_truncate_tokens_keeps_a_token_prefix():
+    llm = object.__new__(LLMInterface)
+    llm.encoding = WordEncoding()
+
+    assert llm.truncate_tokens("one two three four", 2) == "one two"
+    assert llm.truncate_tokens("one two", 5) == "one two"
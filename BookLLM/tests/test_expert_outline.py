@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+# The expert agents pull in the knowledge retrievers' optional clients
+pytest.importorskip("wikipedia")
+pytest.importorskip("arxiv")
+
+from BookLLM.src.agents.enhanced_agents import ExpertOutlineAgent
+from BookLLM.src.models.state import BookState
+
+
+def test_outline_parser_handles_common_chapter_shapes():
+    outline = "\n".join(
+        [
+            "Chapter 1: Foundations",
+            "Chapter 2 - Linear Models",
+            "2.1 Subsection detail",
+            "## Neural Networks",
+            "4. Deployment",
+            "  4.2 Monitoring in production",
+        ]
+    )
+    agent = object.__new__(ExpertOutlineAgent)
+
+    chapters = agent._parse_outline_to_chapters(outline, BookState(topic="ML"))
+
+    assert chapters[:4] == [
+        "Foundations",
+        "Linear Models",
+        "Neural Networks",
+        "Deployment",
+    ]
+    assert chapters[4] == "Advanced ML Topic 5"
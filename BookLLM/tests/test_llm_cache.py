@@ -0,0 +1,90 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.agents.content.back_matter import AcknowledgmentsAgent, IndexAgent
+from BookLLM.src.agents.content.front_matter import BookTitleAgent, DedicationAgent
+from BookLLM.src.models.state import BookState
+from BookLLM.src.utils.llm_cache import SemanticCache
+
+
+class DummyLLM:
+    def __init__(self, output_dir):
+        self.system_config = types.SimpleNamespace(
+            output_dir=output_dir, cache_responses=True
+        )
+        self.calls = 0
+
+    def call_llm(self, prompt, **kwargs):
+        self.calls += 1
+        return (f"response {self.calls}", {})
+
+
+def test_exact_and_semantic_lookup(tmp_path):
+    embeddings = {"alpha": [1.0, 0.0], "alpha!": [0.99, 0.05], "beta": [0.0, 1.0]}
+    cache = SemanticCache(tmp_path / "cache.sqlite", embed_fn=embeddings.get)
+    cache.put("alpha", "A", "ns")
+
+    assert cache.get("alpha", "ns") == "A"
+    assert cache.get("alpha!", "ns") is None
+    assert cache.get("alpha!", "ns", semantic=True) == "A"
+    assert cache.get("beta", "ns", semantic=True) is None
+    assert cache.get("alpha", "other") is None
+
+
+def test_cacheable_agent_reuses_response(tmp_path):
+    llm = DummyLLM(tmp_path)
+    agent = AcknowledgmentsAgent(llm)
+
+    first = agent._execute_logic(BookState(topic="LLM"))
+    second = agent._execute_logic(BookState(topic="LLM"))
+
+    assert first.acknowledgments == second.acknowledgments == "response 1"
+    assert llm.calls == 1
+
+
+def test_uncached_agent_always_calls_llm(tmp_path):
+    llm = DummyLLM(tmp_path)
+    agent = IndexAgent(llm)
+
+    agent._execute_logic(BookState(topic="LLM", chapter_map={"Intro": "Text"}))
+    agent._execute_logic(BookState(topic="LLM", chapter_map={"Intro": "Text"}))
+
+    assert llm.calls == 2
+
+
+def test_uncached_agent_uses_cache_only_with_zero_temperature(tmp_path):
+    llm = DummyLLM(tmp_path)
+    llm.model_config = types.SimpleNamespace(name="m", temperature=0.7, top_p=0.9)
+    agent = BookTitleAgent(llm)
+
+    agent._execute_logic(BookState(topic="LLM"))
+    agent._execute_logic(BookState(topic="LLM"))
+    assert llm.calls == 2
+
+    llm.model_config.temperature = 0
+    first = agent._execute_logic(BookState(topic="LLM"))
+    second = agent._execute_logic(BookState(topic="LLM"))
+    assert first.book_title == second.book_title == "response 3"
+    assert llm.calls == 3
+
+
+def test_front_matter_semantic_lookup_is_scoped_to_the_book(tmp_path):
+    llm = DummyLLM(tmp_path)
+    llm.model_config = types.SimpleNamespace(
+        name="m", temperature=0.7, top_p=0.9, embedding_model="embed"
+    )
+    # Every prompt looks alike, as the fixed boilerplate makes them in practice
+    llm.embed = lambda text: [1.0, 0.0]
+    agent = DedicationAgent(llm)
+
+    first = agent._execute_logic(BookState(topic="LLM"))
+    again = agent._execute_logic(BookState(topic="LLM"))
+    other_topic = agent._execute_logic(BookState(topic="Cooking"))
+    other_style = agent._execute_logic(BookState(topic="LLM", book_style="casual"))
+
+    assert first.dedication == again.dedication == "response 1"
+    assert other_topic.dedication == "response 2"
+    assert other_style.dedication == "response 3"
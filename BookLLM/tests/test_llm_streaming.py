@@ -0,0 +1,80 @@
+import asyncio
+import sys
+import types
+import weakref
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.interfaces.llm import EnhancedLLMInterface
+from BookLLM.src.models.config import CostConfig, ModelConfig
+from BookLLM.src.utils.concurrency import run_async
+from BookLLM.src.utils.metrics import TokenMetricsTracker
+
+
+class CharEncoding:
+    def encode(self, text):
+        return list(text)
+
+
+def _llm(handler):
+    llm = object.__new__(EnhancedLLMInterface)
+    llm.model_config = ModelConfig(name="test-model")
+    llm.cost_config = CostConfig()
+    llm.metrics = TokenMetricsTracker()
+    llm.encoding = CharEncoding()
+    client = httpx.AsyncClient(
+        base_url="http://ollama", transport=httpx.MockTransport(handler)
+    )
+    llm._http_client = lambda: client
+    return llm
+
+
+async def _collect(llm):
+    return [chunk async for chunk in llm.astream_llm("Write", system_prompt="S")]
+
+
+def test_stream_records_usage_from_final_event():
+    def handler(request):
+        return httpx.Response(
+            200,
+            content=(
+                b'{"response": "Hel", "done": false}\n'
+                b'{"response": "lo", "done": false}\n'
+                b'{"response": "", "done": true, '
+                b'"prompt_eval_count": 7, "eval_count": 2}\n'
+            ),
+        )
+
+    llm = _llm(handler)
+    assert asyncio.run(_collect(llm)) == ["Hel", "lo"]
+    assert llm.metrics.metrics["input_tokens"] == 7
+    assert llm.metrics.metrics["output_tokens"] == 2
+
+
+def test_stream_estimates_usage_without_server_counts():
+    def handler(request):
+        return httpx.Response(200, content=b'{"response": "Hello", "done": true}\n')
+
+    llm = _llm(handler)
+    assert asyncio.run(_collect(llm)) == ["Hello"]
+    # Character "tokens" for "S\n\nWrite" and "Hello"
+    assert llm.metrics.metrics["input_tokens"] == 8
+    assert llm.metrics.metrics["output_tokens"] == 5
+
+
+def test_run_async_closes_the_loop_http_client():
+    llm = object.__new__(EnhancedLLMInterface)
+    llm.model_config = ModelConfig(name="test-model")
+    llm.system_config = types.SimpleNamespace(max_workers=2, batch_size=1)
+    llm._clients = weakref.WeakKeyDictionary()
+
+    async def use_client():
+        return llm._http_client()
+
+    client = run_async(use_client())
+
+    assert client.is_closed
+    assert len(llm._clients) == 0
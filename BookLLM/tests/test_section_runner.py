@@ -0,0 +1,143 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.agents.content.back_matter import (
+    AboutAuthorAgent,
+    AcknowledgmentsAgent,
+    IndexAgent,
+)
+from BookLLM.src.agents.content.front_matter import DedicationAgent, ForewordAgent
+from BookLLM.src.agents.content.sections import agenerate_sections
+from BookLLM.src.models.state import BookState
+
+
+class DummyLLM:
+    def __init__(self, output_dir):
+        self.system_config = types.SimpleNamespace(
+            output_dir=output_dir,
+            max_retries=1,
+            retry_delay=0.0,
+            save_intermediates=False,
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def acall_llm(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if "index" in prompt:
+            return ("Alpha\nBeta", {})
+        return ("Generated section", {})
+
+
+class FailingLLM(DummyLLM):
+    async def acall_llm(self, prompt, **kwargs):
+        raise RuntimeError("boom")
+
+
+def test_back_matter_runs_concurrently_and_merges(tmp_path):
+    llm = DummyLLM(tmp_path)
+    state = BookState(topic="LLM", chapter_map={"Intro": "Text"})
+    agents = {
+        "about_the_author": AboutAuthorAgent(llm),
+        "acknowledgments": AcknowledgmentsAgent(llm),
+        "index_terms": IndexAgent(llm),
+    }
+
+    result = asyncio.run(agenerate_sections(agents, state))
+
+    assert llm.max_in_flight == 3
+    assert result.about_the_author == "Generated section"
+    assert result.acknowledgments == "Generated section"
+    assert result.index_terms == ["Alpha", "Beta"]
+    assert (tmp_path / "about_author.tex").read_text() == "Generated section"
+    assert result.completed_steps == [
+        "AboutAuthorAgent",
+        "AcknowledgmentsAgent",
+        "IndexAgent",
+    ]
+
+
+def test_back_matter_records_failures(tmp_path):
+    state = BookState(topic="LLM")
+    agents = {"acknowledgments": AcknowledgmentsAgent(FailingLLM(tmp_path))}
+
+    result = asyncio.run(agenerate_sections(agents, state))
+
+    assert result.acknowledgments is None
+    assert result.errors == ["AcknowledgmentsAgent: boom"]
+
+
+def test_index_skips_llm_for_empty_or_unchanged_content(tmp_path):
+    llm = DummyLLM(tmp_path)
+    agent = IndexAgent(llm)
+    llm.calls = 0
+    original = llm.acall_llm
+
+    async def counting_acall_llm(prompt, **kwargs):
+        llm.calls += 1
+        return await original(prompt, **kwargs)
+
+    llm.acall_llm = counting_acall_llm
+
+    empty = asyncio.run(agent._aexecute_logic(BookState(topic="LLM")))
+    assert empty.index_terms == []
+    assert llm.calls == 0
+
+    state = BookState(topic="LLM", chapter_map={"Intro": "Text"})
+    first = asyncio.run(agenerate_sections({"index_terms": agent}, state))
+    second = asyncio.run(agenerate_sections({"index_terms": agent}, first))
+    assert second.index_terms == ["Alpha", "Beta"]
+    assert llm.calls == 1
+
+
+class BlockingLLM(DummyLLM):
+    def __init__(self, output_dir):
+        super().__init__(output_dir)
+        self.lock = threading.Lock()
+
+    def call_llm(self, prompt, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return ("Front matter", {})
+
+
+def test_sync_front_matter_agents_run_concurrently(tmp_path):
+    llm = BlockingLLM(tmp_path)
+    agents = {"foreword": ForewordAgent(llm), "dedication": DedicationAgent(llm)}
+
+    result = asyncio.run(agenerate_sections(agents, BookState(topic="LLM")))
+
+    assert llm.max_in_flight == 2
+    assert result.foreword == result.dedication == "Front matter"
+    assert result.completed_steps == ["ForewordAgent", "DedicationAgent"]
+
+
+def test_section_agents_get_isolated_metadata(tmp_path):
+    llm = DummyLLM(tmp_path)
+    state = BookState(
+        topic="LLM", chapter_map={"Intro": "Text"}, metadata={"keep": {"a": 1}}
+    )
+    agents = {
+        "acknowledgments": AcknowledgmentsAgent(llm),
+        "index_terms": IndexAgent(llm),
+    }
+    original_metadata = state.metadata
+
+    result = asyncio.run(agenerate_sections(agents, state))
+
+    assert result.metadata is original_metadata
+    assert result.metadata["keep"] == {"a": 1}
+    assert "index_source_hash" in result.metadata
@@ -0,0 +1,89 @@
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from BookLLM.src.monitoring import (
+    status_updates,
+    subscribe_status,
+    unsubscribe_status,
+)
+from BookLLM.src.ui.realtime_integration import RealTimeStatusManager
+
+
+def test_status_updates_reach_every_subscriber():
+    first, second = subscribe_status(), subscribe_status()
+
+    status_updates.put({"current_agent": "ChapterAgent"})
+
+    assert first.get(timeout=1) == {"current_agent": "ChapterAgent"}
+    assert second.get(timeout=1) == {"current_agent": "ChapterAgent"}
+
+    unsubscribe_status(second)
+    status_updates.put({"current_agent": "QuizAgent"})
+    assert first.get(timeout=1) == {"current_agent": "QuizAgent"}
+    assert second.empty()
+    unsubscribe_status(first)
+
+
+def test_realtime_status_subscribers_receive_updates():
+    manager = RealTimeStatusManager()
+    manager.is_running = True
+    threading.Thread(target=manager._process_status_updates, daemon=True).start()
+    updates = manager.subscribe()
+
+    manager.update_agent_status("outline", current_step="executing")
+
+    assert updates.get(timeout=2)["data"]["current_step"] == "executing"
+    manager.unsubscribe(updates)
+    assert manager.listeners == []
+    manager.is_running = False
+
+
+async def _no_websocket_server():
+    pass
+
+
+def test_status_manager_started_without_loop_delivers_updates():
+    manager = RealTimeStatusManager()
+    manager._start_websocket_server = _no_websocket_server
+    manager.start_status_manager()
+    updates = manager.subscribe()
+
+    manager.update_agent_status("outline", current_step="executing")
+
+    assert updates.get(timeout=2)["data"]["current_step"] == "executing"
+    manager.unsubscribe(updates)
+    manager.stop_status_manager()
+
+
+def test_enhanced_sse_stream_receives_status_update(monkeypatch):
+    pytest.importorskip("flask_cors")
+    from BookLLM.src import api_enhanced
+
+    manager = RealTimeStatusManager()
+    manager._start_websocket_server = _no_websocket_server
+    manager.add_listener(api_enhanced._status_cache.invalidate)
+    monkeypatch.setattr(api_enhanced, "status_manager", manager)
+    monkeypatch.setattr(
+        api_enhanced,
+        "ui_orchestrator",
+        types.SimpleNamespace(get_current_status=manager.get_current_status),
+    )
+    manager.start_status_manager()
+
+    response = api_enhanced.app.test_client().get(
+        "/events/enhanced-status", buffered=False
+    )
+    events = iter(response.response)
+    assert b'"agents":{}' in next(events)
+
+    manager.update_agent_status("outline", current_step="executing")
+
+    assert b'"current_step":"executing"' in next(events)
+    response.close()
+    manager.stop_status_manager()
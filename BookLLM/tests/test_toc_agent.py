@@ -14,3 +14,8 @@ def test_table_of_contents_links():
     new_state = agent._execute_logic(state)
     assert "[Intro](#chapter-1-intro)" in new_state.table_of_contents
     assert "[Advanced Topics](#chapter-2-advanced-topics)" in new_state.table_of_contents
+
+
+def test_slugify_collapses_separators():
+    slug = TableOfContentsAgent._slugify("  C++ & Rust: Café -- 2024! ")
+    assert slug == "c-rust-caf-2024"
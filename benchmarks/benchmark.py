@@ -1,3 +1,4 @@
+import asyncio
 import time
 from pathlib import Path
 import sys
@@ -36,6 +37,41 @@ class DummyLLM:
     async def acall_llm(self, prompt: str, json_mode: bool = False, **kwargs):
         return self.call_llm(prompt, json_mode=json_mode, **kwargs)
 
+    async def acall_llm_batch(self, prompts, return_exceptions=False, **kwargs):
+        return [self.call_llm(p, **kwargs) for p in prompts]
+
+
+class LatencyLLM(DummyLLM):
+    """LLM stub with a fixed per-request latency and parallel server slots.
+
+    Like the real interface, ``acall_llm_batch`` sends one request per prompt,
+    so a batch only runs as fast as the free slots allow.
+    """
+
+    def __init__(self, latency: float = 0.05, slots: int = 8):
+        super().__init__()
+        self.latency = latency
+        self.slots = slots
+        self._loop = None
+        self._free_slots = None
+
+    async def acall_llm(self, prompt: str, json_mode: bool = False, **kwargs):
+        # Agents may run each call on a fresh loop, so the slots follow the loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._free_slots = loop, asyncio.Semaphore(self.slots)
+        async with self._free_slots:
+            await asyncio.sleep(self.latency)
+        return self.call_llm(prompt, json_mode=json_mode, **kwargs)
+
+    async def acall_llm_batch(self, prompts, return_exceptions=False, **kwargs):
+        return list(
+            await asyncio.gather(
+                *(self.acall_llm(p, **kwargs) for p in prompts),
+                return_exceptions=return_exceptions,
+            )
+        )
+
 
 def measure_agent(agent_cls, state, input_size, llm):
     """Measure execution time of an agent."""
@@ -79,6 +115,18 @@ def main():
     state = BookState(topic="Benchmark", chapter_map=chapter_map, chapters=["Intro"])
     results.append(measure_agent(CodeSampleAgent, state, 1, llm))
 
+    # ChapterWriterAgent on 16 chapters: a batch of N keeps N requests in flight,
+    # like N workers, and the server slots cap both
+    chapters = [f"Chapter {i}" for i in range(1, 17)]
+    latency_llm = LatencyLLM()
+    for batch_size, max_workers in [(1, 1), (1, 4), (4, 1), (1, 8), (8, 1), (4, 4)]:
+        latency_llm.system_config.batch_size = batch_size
+        latency_llm.system_config.max_workers = max_workers
+        state = BookState(topic="Benchmark", chapters=chapters.copy())
+        row = measure_agent(ChapterWriterAgent, state, len(chapters), latency_llm)
+        row["agent_name"] += f"[batch={batch_size},workers={max_workers}]"
+        results.append(row)
+
     df = pd.DataFrame(results)
     output_dir = Path("benchmarks")
     output_dir.mkdir(exist_ok=True)